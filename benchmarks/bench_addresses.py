@@ -0,0 +1,77 @@
+# Benchmark of address resolution: exact matches, spelling variants caught by the canonical key, and typos left to
+# the trigram fuzzy match, over a synthetic address book; then grouping packages by stop with a string lookup per
+# package against reading the cached Package.location.
+# Run from the project root with: python -m benchmarks.bench_addresses [addresses]
+import random
+import sys
+import time
+
+from wgups.address_book import AddressBook
+from wgups.package import create_package_from_csv_row
+
+STREETS = ["Main St", "State St", "Canyon Rd", "Parkway Blvd", "Taylorsville Blvd", "Lester St", "Price Ave"]
+SPELLED_OUT = {"St": "Street", "Rd": "Road", "Blvd": "Boulevard", "Ave": "Avenue", "S": "South", "W": "West",
+               "E": "East", "N": "North"}
+
+
+def synthetic_addresses(count, rng):
+    addresses = set()
+    while len(addresses) < count:
+        if rng.random() < 0.5:
+            addresses.add(f"{rng.randrange(1, 9999)} {rng.choice(STREETS)}")
+        else:
+            addresses.add(f"{rng.randrange(1, 9999)} {rng.choice('NSEW')} {rng.randrange(1, 99)}00 "
+                          f"{rng.choice('NSEW')}")
+    return sorted(addresses)
+
+
+def spelled_out(address):
+    return " ".join(SPELLED_OUT.get(word, word) for word in address.split())
+
+
+def typo(address, rng):
+    position = rng.randrange(address.index(" ") + 1, len(address))
+    return address[:position] + address[position + 1:]
+
+
+def time_resolve(address_book, queries):
+    start = time.perf_counter()
+    resolved = sum(address_book.resolve(query) is not None for query in queries)
+    return (time.perf_counter() - start) / len(queries) * 1e6, resolved
+
+
+def bench(count):
+    rng = random.Random(count)
+    address_book = AddressBook()
+    addresses = synthetic_addresses(count, rng)
+    for address in addresses:
+        address_book.add_address(address)
+    sample = rng.sample(addresses, min(2_000, count))
+    print(f"{count:,} addresses, {len(sample):,} queries each")
+    for label, queries in [("exact", sample), ("spelled out", [spelled_out(address) for address in sample]),
+                           ("one typo", [typo(address, rng) for address in sample])]:
+        per_lookup, resolved = time_resolve(address_book, queries)
+        print(f"  {label:<12} {per_lookup:8.2f} us/lookup  {resolved:,} resolved")
+
+    packages = [create_package_from_csv_row([str(i), spelled_out(rng.choice(addresses)), "", "", "", "EOD", "1", ""])
+                for i in range(50_000)]
+    for package in packages:
+        package.location = address_book.resolve(package.address)
+    start = time.perf_counter()
+    by_lookup = {}
+    for package in packages:
+        by_lookup.setdefault(address_book.address_lookup(package.address), []).append(package)
+    lookup_time = time.perf_counter() - start
+    start = time.perf_counter()
+    by_location = {}
+    for package in packages:
+        by_location.setdefault(package.location, []).append(package)
+    location_time = time.perf_counter() - start
+    assert by_lookup == by_location
+    print(f"  group {len(packages):,} packages by stop: address lookup {lookup_time * 1000:6.1f}ms  "
+          f"cached location {location_time * 1000:6.1f}ms")
+
+
+if __name__ == "__main__":
+    for size in [int(arg) for arg in sys.argv[1:]] or [10_000]:
+        bench(size)
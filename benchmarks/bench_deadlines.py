@@ -0,0 +1,39 @@
+# Benchmark of deadline aware routing against distance only routing over generated manifests: the late packages,
+# miles and run time of a full day in each mode.
+# Run from the project root with: python -m benchmarks.bench_deadlines [packages ...]
+import sys
+import time
+
+from benchmarks.bench_events import synthetic_simulation
+
+SIZES = [1_000, 5_000, 10_000]
+PACKAGES_PER_TRUCK = 50
+ADDRESSES = 300
+# A city sized area where a 16 package trip takes a couple of hours, with a tenth of the packages due at each of 9:00,
+# 10:30 and noon, so the order of a trip's stops decides whether they make it
+EXTENT_MILES = 6
+DEADLINES = ["EOD"] * 7 + ["9:00 AM", "10:30 AM", "12:00 PM"]
+
+
+def run_day(packages, deadline_routing):
+    simulation = synthetic_simulation(packages // PACKAGES_PER_TRUCK, packages, ADDRESSES, seed=packages,
+                                      extent=EXTENT_MILES, deadlines=DEADLINES,
+                                      deadline_routing=deadline_routing)
+    start = time.perf_counter()
+    miles = simulation.run()
+    elapsed = time.perf_counter() - start
+    return len(simulation.late_packages()), miles, elapsed
+
+
+def bench(packages):
+    print(f"{packages:,} packages on {packages // PACKAGES_PER_TRUCK} trucks")
+    baseline_late, baseline_miles, baseline_time = run_day(packages, False)
+    late, miles, elapsed = run_day(packages, True)
+    print(f"  distance only   late {baseline_late:6,}  miles {baseline_miles:10,.1f}  {baseline_time:7.3f}s")
+    print(f"  deadline aware  late {late:6,}  miles {miles:10,.1f}  {elapsed:7.3f}s  "
+          f"({(miles / baseline_miles - 1) * 100:+.1f}% miles)")
+
+
+if __name__ == "__main__":
+    for size in [int(arg) for arg in sys.argv[1:]] or SIZES:
+        bench(size)
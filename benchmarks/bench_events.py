@@ -0,0 +1,59 @@
+# Benchmark of a full day on the event-driven simulator: a synthetic fleet and manifest, timed from trip assignment
+# through the last truck getting back to the hub, with a hook counting every event.
+# Run from the project root with: python -m benchmarks.bench_events [trucks] [packages] [addresses]
+import random
+import sys
+import time
+from collections import Counter
+
+from benchmarks.bench_routing import random_matrix
+from wgups.address_book import AddressBook
+from wgups.events import EVENT_KINDS
+from wgups.hash_table import HashTable
+from wgups.package import create_package_from_csv_row
+from wgups.simulation import Simulation
+
+DEADLINES = ["EOD"] * 8 + ["10:30 AM", "9:00 AM"]
+
+
+# A Simulation whose tables are built in memory: addresses at random points on a square extent miles across, and
+# packages spread over them. options go to Simulation.
+def synthetic_simulation(trucks, packages, addresses, seed=0, extent=30, deadlines=DEADLINES, **options):
+    rng = random.Random(seed)
+    simulation = Simulation(truck_numbers=range(1, trucks + 1), **options)
+    simulation.address_corrections = []  # Helper's package 9 correction is not for this manifest
+    address_book = AddressBook()
+    for index in range(addresses):
+        address_book.add_address("HUB" if index == 0 else f"{index} Synthetic Way")
+    packages_table = HashTable()
+    for package_id in range(1, packages + 1):
+        notes = "Delayed on flight---will not arrive to depot until 9:05 am" if rng.random() < 0.02 else ""
+        row = [str(package_id), f"{rng.randrange(1, addresses)} Synthetic Way", "Salt Lake City", "UT", "84115",
+               rng.choice(deadlines), str(rng.randrange(1, 50)), notes]
+        packages_table.insert(row[0], create_package_from_csv_row(row, simulation.day_start))
+    simulation.address_book = address_book
+    simulation.packages_table = packages_table
+    simulation.distance_matrix = random_matrix(addresses, seed, extent)
+    return simulation
+
+
+def bench(trucks, packages, addresses):
+    simulation = synthetic_simulation(trucks, packages, addresses)
+    counts = Counter()
+    for kind in EVENT_KINDS:
+        simulation.add_hook(kind, lambda event: counts.update((event.kind,)))
+
+    start = time.perf_counter()
+    miles = simulation.run()
+    elapsed = time.perf_counter() - start
+
+    delivered = sum(package.status == "Delivered" for _, package in simulation.packages_table)
+    print(f"{trucks} trucks, {packages:,} packages, {addresses:,} addresses: full day in {elapsed:6.3f}s")
+    print(f"  {simulation.events.handled:,} events {dict(counts)}")
+    print(f"  {len(simulation.trips):,} trips, {delivered:,} delivered, {len(simulation.unassigned_packages):,} "
+          f"unassigned, {miles:,.1f} miles")
+
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:]]
+    bench(args[0] if args else 50, args[1] if len(args) > 1 else 20_000, args[2] if len(args) > 2 else 500)
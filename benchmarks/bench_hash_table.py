@@ -0,0 +1,103 @@
+# Micro-benchmark comparing the resizing open addressing HashTable against the original fixed size chained table.
+# Run from the project root with: python -m benchmarks.bench_hash_table
+import random
+import sys
+import time
+
+from wgups.hash_table import HashTable
+
+SIZES = [50, 10_000, 1_000_000]
+SAMPLE = 1_000
+
+
+# The original HashTable(50): a fixed number of buckets, each holding a list of (key, value) tuples.
+class ChainedHashTable:
+    def __init__(self, size):
+        self.size = size
+        self.table = [None] * size
+
+    def _hash(self, key):
+        return hash(key) % self.size
+
+    def insert(self, key, value):
+        index = self._hash(key)
+        if self.table[index] is None:
+            self.table[index] = [(key, value)]
+        else:
+            for i, (k, v) in enumerate(self.table[index]):
+                if k == key:
+                    self.table[index][i] = (key, value)
+                    return
+            self.table[index].append((key, value))
+
+    # Bulk load straight into the chains, skipping the duplicate scan so large tables can be built at all.
+    def append_unchecked(self, key, value):
+        index = self._hash(key)
+        if self.table[index] is None:
+            self.table[index] = []
+        self.table[index].append((key, value))
+
+    def get(self, key):
+        index = self._hash(key)
+        if self.table[index] is not None:
+            for k, value in self.table[index]:
+                if k == key:
+                    return value
+        return None
+
+    def delete(self, key):
+        index = self._hash(key)
+        if self.table[index] is not None:
+            for i, (k, v) in enumerate(self.table[index]):
+                if k == key:
+                    del self.table[index][i]
+                    return
+
+
+# Returns the average nanoseconds per call of operation over keys.
+def time_per_op(operation, keys):
+    start = time.perf_counter()
+    for key in keys:
+        operation(key)
+    return (time.perf_counter() - start) / len(keys) * 1e9
+
+
+def bench(n):
+    rng = random.Random(n)
+    keys = [str(i) for i in range(1, n + 1)]
+    sample = rng.sample(keys, min(SAMPLE, n))
+    missing = [str(n + i) for i in range(1, len(sample) + 1)]
+
+    start = time.perf_counter()
+    table = HashTable()
+    for key in keys:
+        table.insert(key, key)
+    new_build = time.perf_counter() - start
+
+    legacy = ChainedHashTable(50)
+    start = time.perf_counter()
+    if n <= 10_000:
+        for key in keys:
+            legacy.insert(key, key)
+    else:
+        for key in keys:
+            legacy.append_unchecked(key, key)
+    legacy_build = time.perf_counter() - start
+
+    rows = [
+        ("build (s)", legacy_build, new_build),
+        ("insert existing (ns/op)", time_per_op(lambda k: legacy.insert(k, k), sample),
+         time_per_op(lambda k: table.insert(k, k), sample)),
+        ("lookup hit (ns/op)", time_per_op(legacy.get, sample), time_per_op(table.get, sample)),
+        ("lookup miss (ns/op)", time_per_op(legacy.get, missing), time_per_op(table.get, missing)),
+        ("delete (ns/op)", time_per_op(legacy.delete, sample), time_per_op(table.delete, sample)),
+    ]
+    print(f"\n{n:,} keys" + (" (chained table bulk loaded without duplicate checks)" if n > 10_000 else ""))
+    print(f"{'operation':<26}{'chained(50)':>16}{'HashTable':>16}{'speedup':>10}")
+    for name, old, new in rows:
+        print(f"{name:<26}{old:>16.4f}{new:>16.4f}{old / new if new else float('inf'):>9.1f}x")
+
+
+if __name__ == "__main__":
+    for size in [int(arg) for arg in sys.argv[1:]] or SIZES:
+        bench(size)
@@ -0,0 +1,105 @@
+# Memory and load time of the manifest representations: the original dict-backed Package that parsed its start
+# time on every row, the __slots__ Package, and the columnar ManifestStore, plus one fleet-wide filter on each.
+# Run from the project root with: python -m benchmarks.bench_manifest [packages ...]
+import gc
+import random
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+from wgups.manifest_store import ManifestStore
+from wgups.package import create_package_from_csv_row
+
+SIZES = [10_000, 100_000]
+CITIES = [("Salt Lake City", "84115"), ("West Valley City", "84119"), ("Murray", "84107"), ("Holladay", "84117")]
+DEADLINES = ["EOD", "EOD", "10:30 AM", "9:00 AM"]
+
+
+# The Package as it was before __slots__: a __dict__ per object and a list status tracker.
+class DictPackage:
+    def __init__(self, package_id, address, city, state, zip_code, delivery_deadline, weight, package_special_notes,
+                 timestamp=None, distance=None, status=None, truck_number=None):
+        self.package_id = package_id
+        self.address = address
+        self.city = city
+        self.state = state
+        self.zip_code = zip_code
+        self.delivery_deadline = delivery_deadline
+        self.weight = weight
+        self.package_special_notes = package_special_notes
+        self.timestamp = timestamp
+        self.distance = distance
+        self.status = status
+        self.status_tracker = [{status, timestamp}]
+        self.truck_number = truck_number
+
+
+def create_dict_package(row):
+    timestamp = datetime.strptime("2023-10-24 08:00:00", "%Y-%m-%d %H:%M:%S")
+    return DictPackage(row[0], row[1], row[2], row[3], row[4], row[5], row[6], row[7], timestamp, 0.0, "At Hub",
+                       "Not Assigned")
+
+
+# CSV-like rows as csv.reader yields them: fresh strings for every field of every row.
+def generate_rows(count, seed):
+    rng = random.Random(seed)
+    rows = []
+    for package_id in range(1, count + 1):
+        city, zip_code = rng.choice(CITIES)
+        rows.append([str(package_id), f"{rng.randrange(1, 9999)} S {rng.randrange(1, 99)}00 E", "".join(city),
+                     "".join("UT"), "".join(zip_code), "".join(rng.choice(DEADLINES)), str(rng.randrange(1, 90)), ""])
+    return rows
+
+
+# Times build untraced, then builds it again under tracemalloc for the memory it keeps alive
+def measure(build):
+    gc.collect()
+    start = time.perf_counter()
+    result = build()
+    elapsed = time.perf_counter() - start
+    del result
+    gc.collect()
+    tracemalloc.start()
+    result = build()
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, elapsed, memory
+
+
+# Best time of a few runs of query, and its result
+def best_of(query, runs=5):
+    best = float("inf")
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = query()
+        best = min(best, time.perf_counter() - start)
+    return result, best
+
+
+def bench(count):
+    rows = generate_rows(count, count)
+    dict_packages, dict_time, dict_memory = measure(lambda: [create_dict_package(row) for row in rows])
+    del dict_packages
+    packages, slots_time, slots_memory = measure(lambda: [create_package_from_csv_row(row) for row in rows])
+    for package in packages[::7]:
+        package.truck_number = 2
+    store, store_time, store_memory = measure(
+        lambda: ManifestStore.from_packages((package.package_id, package) for package in packages))
+
+    loop_ids, loop_time = best_of(
+        lambda: [package.package_id for package in packages if package.status == "At Hub" and package.truck_number == 2])
+    store_ids, select_time = best_of(lambda: store.select(status="At Hub", truck=2))
+    assert loop_ids == store_ids
+
+    print(f"\n{count:,} packages")
+    print(f"  dict Package      load {dict_time:7.3f}s  memory {dict_memory / count:7.0f} B/package")
+    print(f"  __slots__ Package load {slots_time:7.3f}s  memory {slots_memory / count:7.0f} B/package")
+    print(f"  ManifestStore     load {store_time:7.3f}s  memory {store_memory / count:7.0f} B/package")
+    print(f"  At Hub on truck 2: object loop {loop_time * 1000:7.1f}ms  columnar select {select_time * 1000:7.1f}ms "
+          f"({len(store_ids):,} packages)")
+
+
+if __name__ == "__main__":
+    for size in [int(arg) for arg in sys.argv[1:]] or SIZES:
+        bench(size)
@@ -0,0 +1,32 @@
+# Benchmark of fleet route planning across worker processes, with the distance matrix in shared memory.
+# Run from the project root with: python -m benchmarks.bench_planner [trucks] [stops per truck]
+import os
+import random
+import sys
+import time
+
+from benchmarks.bench_routing import random_matrix
+from wgups.planner import plan_routes
+
+
+def bench(trucks, stops_per_truck):
+    matrix = random_matrix(trucks * stops_per_truck + 1, trucks)
+    points = list(range(1, matrix.size))
+    random.Random(trucks).shuffle(points)
+    stop_sets = {truck: points[truck * stops_per_truck:(truck + 1) * stops_per_truck] for truck in range(trucks)}
+
+    baseline = None
+    worker_counts = sorted({1, 2, 4, os.cpu_count() or 1})
+    print(f"{trucks} trucks x {stops_per_truck} stops, 2-opt / Or-opt on, {os.cpu_count()} cores")
+    for workers in worker_counts:
+        start = time.perf_counter()
+        plans = plan_routes(matrix, stop_sets, improve=True, time_budget=5.0, max_workers=workers)
+        elapsed = time.perf_counter() - start
+        baseline = baseline or elapsed
+        miles = sum(plan.distance_after for plan in plans.values())
+        print(f"  {workers:>3} workers  {elapsed:8.3f}s  speedup {baseline / elapsed:5.2f}x  miles {miles:10.1f}")
+
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:]]
+    bench(args[0] if args else 40, args[1] if len(args) > 1 else 100)
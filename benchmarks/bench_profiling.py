@@ -0,0 +1,39 @@
+# Cost of the profiler: the same synthetic day run plain and instrumented. A Simulation that is never instrumented
+# runs no profiling code at all, so the plain run is also the cost of having profiling available but off.
+# Run from the project root with: python -m benchmarks.bench_profiling [trucks] [packages] [addresses]
+import sys
+import time
+
+from benchmarks.bench_events import synthetic_simulation
+from wgups.profiling import Profiler
+
+RUNS = 3
+
+
+def best_run(trucks, packages, addresses, profile):
+    best = float("inf")
+    profiler = None
+    for _ in range(RUNS):
+        simulation = synthetic_simulation(trucks, packages, addresses)
+        profiler = Profiler().instrument(simulation) if profile else None
+        start = time.perf_counter()
+        simulation.run()
+        best = min(best, time.perf_counter() - start)
+    return best, profiler
+
+
+def bench(trucks, packages, addresses):
+    plain, _ = best_run(trucks, packages, addresses, False)
+    profiled, profiler = best_run(trucks, packages, addresses, True)
+    print(f"{trucks} trucks, {packages:,} packages: plain {plain:.3f}s  profiled {profiled:.3f}s  "
+          f"overhead {(profiled / plain - 1) * 100:+.1f}%")
+    report = profiler.report()
+    for name, stage in report["stages"].items():
+        print(f"  {name:<20} {stage['seconds']:8.3f}s  {stage['calls']:8,} calls")
+    for name, value in report["counters"].items():
+        print(f"  {name:<20} {value:12,}")
+
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:]]
+    bench(args[0] if args else 50, args[1] if len(args) > 1 else 20_000, args[2] if len(args) > 2 else 500)
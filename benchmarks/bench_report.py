@@ -0,0 +1,71 @@
+# The "status of all packages at a time" report: the original path (re-sort the table, then a summary dict lookup
+# and a print per package) against status_rows and the buffered write_report, writing to a null device.
+# Run from the project root with: python -m benchmarks.bench_report [packages ...]
+import os
+import random
+import sys
+import time
+from contextlib import redirect_stdout
+from datetime import datetime
+
+from benchmarks.synthetic import generate_addresses, generate_manifest, generate_points
+from wgups.hash_table import HashTable
+from wgups.package import create_package_from_csv_row
+from wgups.report import REPORT_FORMATS, status_rows, write_report
+from wgups.status_history import fleet_status_at
+
+SIZES = [1_000, 10_000, 100_000]
+TIMESTAMP = datetime(2023, 10, 24, 10, 0)
+
+
+def packages_table(count):
+    rng = random.Random(count)
+    addresses = generate_addresses(1_000, rng)
+    points, cities = generate_points(1_000, rng)
+    rows, deltas = generate_manifest(count, addresses, cities, 50, rng)
+    table = HashTable()
+    for row in rows:
+        table.insert(row[0], create_package_from_csv_row(row))
+    return table
+
+
+# main.py's report before status_rows and write_report
+def legacy_report(table, timestamp):
+    sorted_packages = sorted(table, key=lambda x: int(x[0]), reverse=False)
+    print("ID | Delivery Address | Delivery Deadline | City | Zip Code | Truck Number | Status Change Time | Status")
+    for package_id, package, status_at_time, delivered_time in fleet_status_at(sorted_packages, timestamp):
+        if status_at_time is None:
+            status_at_time = "Status not available at {}".format(timestamp)
+        package_data = table.lookup(str(package_id))
+        if delivered_time:
+            print(" {} | {} | {} | {} | {} | {} | {} | {} |".format(
+                package_id, package_data.get('address', ''), package_data.get('deadline', ''),
+                package_data.get('city', ''), package_data.get('zip_code', ''), package.truck_number, delivered_time,
+                status_at_time))
+        else:
+            print("Status at {}: {}".format(timestamp, status_at_time))
+
+
+def best_time(function, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def bench(count):
+    table = packages_table(count)
+    with open(os.devnull, 'w') as null, redirect_stdout(null):
+        legacy = best_time(lambda: legacy_report(table, TIMESTAMP))
+        timings = {report_format: best_time(lambda: write_report(status_rows(table, TIMESTAMP), null, report_format,
+                                                                 TIMESTAMP))
+                   for report_format in REPORT_FORMATS}
+    print(f"{count:>8,} packages  legacy {legacy:7.3f}s  " + "  ".join(
+        f"{report_format} {seconds:7.3f}s ({legacy / seconds:4.1f}x)" for report_format, seconds in timings.items()))
+
+
+if __name__ == "__main__":
+    for size in [int(arg) for arg in sys.argv[1:]] or SIZES:
+        bench(size)
@@ -0,0 +1,72 @@
+# Benchmark of the nearest neighbor router against the original tuple building implementation.
+# Run from the project root with: python -m benchmarks.bench_routing [stops ...]
+import math
+import random
+import sys
+import time
+from array import array
+
+from wgups.distance_matrix import DistanceMatrix
+from wgups.routing import find_nearest_neighbor_route_and_distances
+
+SIZES = [1_000, 5_000]
+
+
+# The original router: builds a (point, distance) list for every step and appends legs to a shared list.
+def legacy_route(distance_matrix, remaining_packages):
+    distances = []
+    unvisited = list(remaining_packages)
+    route = [0]
+    while unvisited:
+        current_point = route[-1]
+        valid_distances = []
+        for point in unvisited:
+            if point < current_point:
+                distance = distance_matrix[current_point][point]
+            else:
+                distance = distance_matrix[point][current_point]
+            if distance is not None:
+                valid_distances.append((point, distance))
+        if valid_distances:
+            nearest_point, distance = min(valid_distances, key=lambda x: x[1])
+            distances.append(distance)
+            route.append(nearest_point)
+            unvisited.remove(nearest_point)
+        else:
+            nearest_point = unvisited.pop(0)
+            route.append(nearest_point)
+    return route, distances
+
+
+# Random points on a square extent miles across with the hub at index 0, as a dense DistanceMatrix.
+def random_matrix(size, seed, extent=30):
+    rng = random.Random(seed)
+    points = [(rng.uniform(0, extent), rng.uniform(0, extent)) for _ in range(size)]
+    values = array('d')
+    for point in points:
+        values.extend([math.dist(point, other) for other in points])
+    return DistanceMatrix(size, memoryview(values))
+
+
+def bench(stops):
+    matrix = random_matrix(stops + 1, stops)
+    rows = [matrix[i] for i in range(matrix.size)]
+    package_indices = list(range(1, matrix.size))
+    random.Random(stops).shuffle(package_indices)
+
+    start = time.perf_counter()
+    legacy, legacy_legs = legacy_route(rows, package_indices)
+    legacy_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    route, legs = find_nearest_neighbor_route_and_distances(matrix, package_indices)
+    new_time = time.perf_counter() - start
+
+    assert route == legacy and legs == legacy_legs, "routes differ"
+    print(f"{stops:>6,} stops  legacy {legacy_time:8.3f}s  argmin {new_time:8.3f}s  "
+          f"speedup {legacy_time / new_time:5.1f}x  miles {sum(legs):10.1f}")
+
+
+if __name__ == "__main__":
+    for size in [int(arg) for arg in sys.argv[1:]] or SIZES:
+        bench(size)
@@ -0,0 +1,64 @@
+# Twenty what-if scenarios (truck counts, start times, speeds and truck capacities) over one synthetic day: each run
+# as a full cold Simulation that loads and parses everything itself, then through run_scenarios in this process,
+# then fanned out over a process pool.
+# Run from the project root with: python -m benchmarks.bench_scenarios [packages] [addresses]
+import os
+import sys
+import tempfile
+import time
+from datetime import timedelta
+
+from benchmarks.bench_suite import clear_matrix_cache
+from benchmarks.synthetic import write_dataset
+from wgups.scenarios import Scenario, comparison_table, run_scenarios
+from wgups.simulation import Simulation
+
+TRUCK_COUNTS = [20, 30, 40, 50, 60]
+
+
+def scenarios():
+    plans = []
+    for trucks in TRUCK_COUNTS:
+        for start, speed, capacity in ((8, 18, 16), (9, 18, 16), (8, 25, 16), (8, 18, 24)):
+            plans.append(Scenario(f"{trucks} trucks {start}:00 {speed}mph cap {capacity}", trucks=trucks,
+                                  day_start=timedelta(hours=start), speed_mph=speed, capacity=capacity))
+    return plans
+
+
+# What every scenario cost before the runner: its own Simulation, loading every table from the CSVs
+def cold_run(directory, scenario):
+    clear_matrix_cache(directory)
+    simulation = Simulation(directory, scenario.day, range(1, scenario.trucks + 1), scenario.day_start,
+                            speed_mph=scenario.speed_mph, capacity=scenario.capacity, max_workers=1)
+    return simulation.run()
+
+
+def bench(packages, addresses):
+    with tempfile.TemporaryDirectory() as directory:
+        write_dataset(directory, packages, addresses, max(TRUCK_COUNTS))
+        plans = scenarios()
+
+        start = time.perf_counter()
+        cold_miles = [cold_run(directory, scenario) for scenario in plans]
+        cold = time.perf_counter() - start
+
+        clear_matrix_cache(directory)
+        start = time.perf_counter()
+        serial = run_scenarios(plans, directory, max_workers=1)
+        serial_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        pooled = run_scenarios(plans, directory)
+        pooled_time = time.perf_counter() - start
+
+    assert [round(result.miles, 6) for result in serial] == [round(miles, 6) for miles in cold_miles], "miles differ"
+    assert [result.miles for result in pooled] == [result.miles for result in serial], "miles differ"
+    print(comparison_table(pooled))
+    print(f"{len(plans)} scenarios, {packages:,} packages, {addresses:,} addresses: cold runs {cold:.2f}s  "
+          f"run_scenarios {serial_time:.2f}s in process ({cold / serial_time:.1f}x), "
+          f"{pooled_time:.2f}s on {os.cpu_count()} CPUs ({cold / pooled_time:.1f}x)")
+
+
+if __name__ == "__main__":
+    args = [int(arg) for arg in sys.argv[1:]]
+    bench(args[0] if args else 5_000, args[1] if len(args) > 1 else 1_000)
@@ -0,0 +1,153 @@
+# Benchmark suite over the synthetic scales in benchmarks/synthetic.py: for each one, the time to load its CSVs (cold,
+# then from the distance matrix's .npy cache), the time to run the whole day and the part of it spent constructing
+# routes, total miles, late and unassigned packages, and peak memory. Datasets are seeded, so every number but the
+# timings is exactly reproducible; save a run with --save and pass it to --compare on a later commit to see what
+# changed.
+# Run from the project root with: python -m benchmarks.bench_suite [--scales tiny,small] [--save out.json]
+#     [--compare baseline.json] [--repeat 3] [--improve-routes] [--deadline-routing]
+import argparse
+import gc
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from benchmarks.synthetic import SCALES, write_scale
+from wgups.profiling import Profiler
+from wgups.simulation import Simulation
+
+TABLES = ("packages_table", "address_book", "distance_matrix")
+# Reported metrics with their units, in column order; times are the best of --repeat runs
+METRICS = (("load", "s"), ("cached_load", "s"), ("day", "s"), ("routing", "s"), ("miles", ""), ("late", ""),
+           ("unassigned", ""), ("peak_memory", "MB"))
+
+
+# A Simulation over the dataset in directory, which applies the dataset's address corrections itself.
+def scale_simulation(directory, trucks, **options):
+    return Simulation(data_dir=directory, truck_numbers=range(1, trucks + 1), **options)
+
+
+def load_tables(simulation):
+    for table in TABLES:
+        getattr(simulation, table)
+
+
+def clear_matrix_cache(directory):
+    try:
+        os.remove(os.path.join(directory, 'WGUPSdistance.npy'))
+    except FileNotFoundError:
+        pass
+
+
+def best_of(repeat, measure):
+    return min(measure() for _ in range(repeat))
+
+
+def timed(function):
+    gc.collect()
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
+
+
+# Every metric for one scale. Time, the stage breakdown and memory each get their own runs, so neither the
+# profiler nor tracemalloc slows down the timings.
+def bench_scale(scale, repeat, **options):
+    packages, addresses, trucks = SCALES[scale]
+    with tempfile.TemporaryDirectory() as directory:
+        write_scale(directory, scale)
+
+        def cold_load():
+            clear_matrix_cache(directory)
+            return timed(lambda: load_tables(scale_simulation(directory, trucks, **options)))
+
+        def cached_load():
+            return timed(lambda: load_tables(scale_simulation(directory, trucks, **options)))
+
+        def day():
+            simulation = scale_simulation(directory, trucks, **options)
+            load_tables(simulation)
+            return timed(simulation.run)
+
+        load = best_of(repeat, cold_load)
+        cached = best_of(repeat, cached_load)
+        day_time = best_of(repeat, day)
+
+        simulation = scale_simulation(directory, trucks, **options)
+        profiler = Profiler().instrument(simulation)
+        miles = simulation.run()
+        routing = profiler.report()["stages"].get("route_construction", {"seconds": 0.0})["seconds"]
+
+        clear_matrix_cache(directory)
+        gc.collect()
+        tracemalloc.start()
+        simulation = scale_simulation(directory, trucks, **options)
+        load_tables(simulation)
+        simulation.run()
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+
+    return {"packages": packages, "addresses": addresses, "trucks": trucks, "load": load, "cached_load": cached,
+            "day": day_time, "routing": routing, "miles": round(miles, 1), "late": len(simulation.late_packages()),
+            "unassigned": len(simulation.unassigned_packages), "peak_memory": peak / 2 ** 20}
+
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def format_change(value, baseline):
+    if baseline is None:
+        return ""
+    if baseline == 0:
+        return " (=)" if value == 0 else " (new)"
+    return f" ({(value / baseline - 1) * 100:+.1f}%)"
+
+
+def print_results(results, baseline):
+    for scale, result in results.items():
+        before = baseline.get(scale, {})
+        print(f"{scale}: {result['packages']:,} packages, {result['addresses']:,} addresses, {result['trucks']:,} "
+              f"trucks")
+        for metric, unit in METRICS:
+            value = result[metric]
+            shown = f"{value:,.3f}{unit}" if unit == "s" else f"{value:,.1f}{unit}" if unit else f"{value:,}"
+            print(f"  {metric:<12} {shown:>14}{format_change(value, before.get(metric))}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark load, routing, miles and memory on synthetic days.")
+    parser.add_argument('--scales', default=",".join(SCALES), help=f"comma separated, from {', '.join(SCALES)}")
+    parser.add_argument('--repeat', type=int, default=3, help="runs per timing; the best is kept")
+    parser.add_argument('--save', metavar='JSON', help="write the results here")
+    parser.add_argument('--compare', metavar='JSON', help="show the change from results saved by an earlier run")
+    parser.add_argument('--improve-routes', action='store_true')
+    parser.add_argument('--deadline-routing', action='store_true')
+    args = parser.parse_args()
+    unknown = [scale for scale in args.scales.split(",") if scale not in SCALES]
+    if unknown:
+        parser.error(f"unknown scale {', '.join(unknown)}")
+    baseline = {}
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as baseline_file:
+            baseline = json.load(baseline_file)["results"]
+
+    options = {"improve_routes": args.improve_routes, "deadline_routing": args.deadline_routing}
+    results = {}
+    for scale in args.scales.split(","):
+        results[scale] = bench_scale(scale, args.repeat, **options)
+        print_results({scale: results[scale]}, baseline)
+        sys.stdout.flush()
+    if args.save:
+        with open(args.save, 'w', encoding='utf-8') as save_file:
+            json.dump({"commit": git_commit(), "python": platform.python_version(), "options": options,
+                       "results": results}, save_file, indent=2)
+            save_file.write("\n")
@@ -0,0 +1,166 @@
+# Seeded generator for delivery days at any scale, written in the same CSV layout as Helper/ so a Simulation loads
+# them exactly like the real day: WGUPSaddress.csv, a lower triangular WGUPSdistance.csv and WGUPSpackage.csv, plus
+# WGUPScorrections.csv with the address corrections for packages listed at the wrong address, which a Simulation of
+# the directory applies by itself. The same arguments always write the same files.
+# Write one from the project root with: python -m benchmarks.synthetic directory packages addresses [trucks] [seed]
+import csv
+import math
+import os
+import random
+import sys
+
+from wgups.simulation import CORRECTIONS_FILE
+
+# Named scales as (packages, addresses, trucks), from about the sample day up to a regional hub
+SCALES = {
+    "tiny": (100, 30, 2),
+    "small": (1_000, 300, 10),
+    "medium": (10_000, 1_000, 100),
+    "large": (100_000, 5_000, 1_000),
+}
+# (city, zip code) for each neighborhood addresses are clustered around
+CITIES = [("Salt Lake City", "84115"), ("Salt Lake City", "84106"), ("West Valley City", "84119"),
+          ("Murray", "84107"), ("Holladay", "84117"), ("Millcreek", "84109"), ("South Salt Lake", "84115"),
+          ("Taylorsville", "84123"), ("Cottonwood Heights", "84121"), ("West Jordan", "84084")]
+STREET_NAMES = ["State St", "Main St", "Canyon Rd", "Dalton Ave S", "Oakland Ave", "Bringhurst St", "Taylorsville Blvd",
+                "Highland Dr", "Redwood Rd", "Van Winkle Expy", "Murray Blvd", "Winchester St", "Holladay Blvd"]
+# The sample manifest's deadline mix: mostly end of day, a third by 10:30 and a few first thing
+DEADLINES = ["EOD"] * 13 + ["10:30 AM"] * 6 + ["9:00 AM"]
+DELAYED_NOTE = "Delayed on flight---will not arrive to depot until 9:05 am"
+WRONG_ADDRESS_NOTE = "Wrong address listed"
+# Share of packages with each special note, and of addresses written out in full ("South" for "S")
+DELAYED_RATE = 0.05
+TRUCK_RATE = 0.05
+GROUP_RATE = 0.02
+WRONG_ADDRESS_RATE = 0.005
+SPELLED_OUT_RATE = 0.01
+_SPELLED_OUT = {"N": "North", "S": "South", "E": "East", "W": "West"}
+EXTENT = 15  # miles across the service area
+
+
+# count distinct street addresses, the hub first. Most are on the Salt Lake grid ("1330 E 2100 S"), the rest on
+# named streets ("233 Canyon Rd").
+# BIG O: O(a)
+# Space Complexity: O(a)
+def generate_addresses(count, rng):
+    addresses = ["HUB"]
+    seen = set(addresses)
+    while len(addresses) < count:
+        house = rng.randrange(100, 9999)
+        if rng.random() < 0.7:
+            east_west, north_south = rng.choice("EW"), rng.choice("NS")
+            street = rng.randrange(1, 99)
+            address = (f"{house} {east_west} {street}00 {north_south}" if rng.random() < 0.5 else
+                       f"{house} {north_south} {street}00 {east_west}")
+        else:
+            address = f"{house} {rng.choice(STREET_NAMES)}"
+        if address not in seen:
+            seen.add(address)
+            addresses.append(address)
+    return addresses
+
+
+# A point in miles for each address, clustered around one neighborhood per city, and the city of each. The hub sits
+# in the middle.
+# BIG O: O(a)
+# Space Complexity: O(a)
+def generate_points(count, rng, extent=EXTENT):
+    centers = [(rng.uniform(0, extent), rng.uniform(0, extent)) for _ in CITIES]
+    points = [(extent / 2, extent / 2)]
+    cities = [CITIES[0]]
+    for _ in range(1, count):
+        neighborhood = rng.randrange(len(CITIES))
+        x, y = centers[neighborhood]
+        points.append((min(max(rng.gauss(x, extent / 8), 0), extent), min(max(rng.gauss(y, extent / 8), 0), extent)))
+        cities.append(CITIES[neighborhood])
+    return points, cities
+
+
+# Writes the lower triangle of the street grid (Manhattan) distances between points, rounded up to a tenth of a
+# mile like WGUPSdistance.csv. Rounding up keeps the triangle inequality, so the matrix stays metric.
+# BIG O: O(a^2)
+# Space Complexity: O(a)
+def write_distance_csv(csv_path, points):
+    with open(csv_path, 'w', encoding='utf-8', newline='') as csv_file:
+        for i, (x, y) in enumerate(points):
+            csv_file.write(",".join([f"{math.ceil((abs(x - other_x) + abs(y - other_y)) * 10) / 10:.1f}"
+                                     for other_x, other_y in points[:i + 1]]) + "\n")
+
+
+def _spelled_out(address):
+    return " ".join(_SPELLED_OUT.get(word, word) for word in address.split(" "))
+
+
+# The WGUPSpackage.csv rows of a manifest and the delta rows correcting its wrong addresses. Special notes follow
+# the sample day: delayed flights, truck restrictions, "Must be delivered with" groups of two to four packages that
+# carry no other note, and a few wrong addresses. Like Helper/WGUPScorrections.csv the corrections leave their time
+# blank, so they apply at the Simulation's address_correction_time, when the loader releases the held packages. A
+# few addresses are spelled out in full to exercise the address normalization.
+# BIG O: O(n)
+# Space Complexity: O(n)
+def generate_manifest(packages, addresses, cities, trucks, rng):
+    rows = []
+    deltas = []
+    grouped = 0  # packages left in the current ship-with group
+    for package_id in range(1, packages + 1):
+        index = rng.randrange(1, len(addresses))
+        address = addresses[index]
+        if rng.random() < SPELLED_OUT_RATE:
+            address = _spelled_out(address)
+        city, zip_code = cities[index]
+        notes = ""
+        roll = rng.random()
+        if grouped:
+            grouped -= 1
+        elif roll < GROUP_RATE and package_id + 3 <= packages:
+            grouped = rng.randrange(1, 4)
+            notes = "Must be delivered with " + ", ".join(str(package_id + offset) for offset in range(1, grouped + 1))
+        elif roll < GROUP_RATE + DELAYED_RATE:
+            notes = DELAYED_NOTE
+        elif roll < GROUP_RATE + DELAYED_RATE + TRUCK_RATE:
+            notes = f"Can only be on truck {rng.randrange(1, trucks + 1)}"
+        elif roll < GROUP_RATE + DELAYED_RATE + TRUCK_RATE + WRONG_ADDRESS_RATE:
+            notes = WRONG_ADDRESS_NOTE
+            correct = rng.randrange(1, len(addresses))
+            correct_city, correct_zip = cities[correct]
+            deltas.append(["", "correct", str(package_id), addresses[correct], correct_city, "UT",
+                           correct_zip])
+        rows.append([str(package_id), address, city, "UT", zip_code, rng.choice(DEADLINES), str(rng.randrange(1, 90)),
+                     notes])
+    return rows, deltas
+
+
+def _write_rows(csv_path, rows):
+    with open(csv_path, 'w', encoding='utf-8', newline='') as csv_file:
+        csv.writer(csv_file, lineterminator="\n").writerows(rows)
+
+
+# Writes a whole day into directory and returns it. The distance matrix depends only on addresses and seed, and the
+# manifest on every argument, so a scale can grow its manifest over the same map.
+# BIG O: O(n + a^2)
+# Space Complexity: O(n + a)
+def write_dataset(directory, packages, addresses, trucks=2, seed=0):
+    os.makedirs(directory, exist_ok=True)
+    rng = random.Random(seed)
+    address_list = generate_addresses(addresses, rng)
+    points, cities = generate_points(addresses, rng)
+    _write_rows(os.path.join(directory, 'WGUPSaddress.csv'), [[address] for address in address_list])
+    write_distance_csv(os.path.join(directory, 'WGUPSdistance.csv'), points)
+    rows, deltas = generate_manifest(packages, address_list, cities, trucks, random.Random(f"{seed}:{packages}"))
+    _write_rows(os.path.join(directory, 'WGUPSpackage.csv'), rows)
+    _write_rows(os.path.join(directory, CORRECTIONS_FILE), deltas)
+    return directory
+
+
+# Writes the named scale's dataset (see SCALES) into directory and returns it.
+# BIG O: O(n + a^2)
+# Space Complexity: O(n + a)
+def write_scale(directory, scale, seed=0):
+    packages, addresses, trucks = SCALES[scale]
+    return write_dataset(directory, packages, addresses, trucks, seed)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 4:
+        sys.exit("usage: python -m benchmarks.synthetic directory packages addresses [trucks] [seed]")
+    write_dataset(sys.argv[1], *[int(arg) for arg in sys.argv[2:6]])
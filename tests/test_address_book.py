@@ -0,0 +1,40 @@
+import os
+import unittest
+
+from wgups.address_book import AddressBook, load_address_book, normalize_address
+from wgups.simulation import DATA_DIR
+
+
+class AddressBookTest(unittest.TestCase):
+    def setUp(self):
+        self.address_book = load_address_book(os.path.join(DATA_DIR, 'WGUPSaddress.csv'))
+
+    def test_canonical_keys(self):
+        self.assertEqual(normalize_address("5383 South 900 East #104"), "5383 s 900 e 104")
+        self.assertEqual(normalize_address("  410 S.  State  Street "), "410 s state st")
+
+    def test_spelled_out_and_abbreviated_directions_resolve_alike(self):
+        spelled_out = self.address_book.resolve("5100 South 2700 West")
+        self.assertIsNotNone(spelled_out)
+        self.assertEqual(self.address_book.resolve("5100 S 2700 W"), spelled_out)
+        self.assertEqual(self.address_book.resolve("410 South State Street"),
+                         self.address_book.resolve("410 S State St"))
+        self.assertEqual(self.address_book.fuzzy_report(), ([], []))
+
+    def test_fuzzy_match_keeps_the_house_number(self):
+        self.assertEqual(self.address_book.resolve("410 S Stat St"), self.address_book.resolve("410 S State St"))
+        self.assertIsNone(self.address_book.resolve("401 S State St"))
+        fuzzy_matches, unresolved = self.address_book.fuzzy_report()
+        self.assertEqual([(address, matched) for address, matched, score in fuzzy_matches],
+                         [("410 S Stat St", "410 S State St")])
+        self.assertEqual([address for address, closest, score in unresolved], ["401 S State St"])
+
+    def test_unrelated_address_is_unresolved(self):
+        address_book = AddressBook()
+        address_book.add_address("HUB")
+        address_book.add_address("410 S State St")
+        self.assertIsNone(address_book.resolve("9 Nowhere Lane"))
+
+
+if __name__ == "__main__":
+    unittest.main()
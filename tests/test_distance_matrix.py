@@ -0,0 +1,37 @@
+import os
+import tempfile
+import unittest
+
+from wgups.distance_matrix import load_distance_matrix
+
+
+class DistanceMatrixCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.csv_path = os.path.join(self.directory.name, 'WGUPSdistance.csv')
+        self.write_csv("0.0\n7.2,0.0\n")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write_csv(self, text):
+        with open(self.csv_path, 'w', encoding='utf-8') as csv_file:
+            csv_file.write(text)
+
+    def test_cache_is_reused(self):
+        load_distance_matrix(self.csv_path)
+        matrix = load_distance_matrix(self.csv_path)
+        self.assertIsNotNone(matrix._backing)
+        self.assertEqual(matrix[1][0], 7.2)
+
+    def test_backdated_csv_is_parsed_again(self):
+        load_distance_matrix(self.csv_path)
+        cache_time = os.stat(os.path.join(self.directory.name, 'WGUPSdistance.npy')).st_mtime_ns
+        self.write_csv("0.0\n3.5,0.0\n")
+        os.utime(self.csv_path, ns=(cache_time - 10 ** 9, cache_time - 10 ** 9))
+        self.assertEqual(load_distance_matrix(self.csv_path)[1][0], 3.5)
+        self.assertEqual(load_distance_matrix(self.csv_path)[0][1], 3.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,88 @@
+import random
+import unittest
+
+from wgups.hash_table import HashTable
+
+
+# A key type whose instances all hash alike, so every key shares one probe chain
+class Colliding:
+    def __init__(self, value):
+        self.value = value
+
+    def __hash__(self):
+        return 7
+
+    def __eq__(self, other):
+        return isinstance(other, Colliding) and other.value == self.value
+
+
+class HashTableTest(unittest.TestCase):
+    def check(self, table, expected):
+        self.assertEqual(len(table), len(expected))
+        self.assertEqual(dict(table), expected)
+        self.assertEqual(list(table), list(expected.items()))  # insertion order, like dict
+
+    def test_random_operations_match_dict(self):
+        rng = random.Random(0)
+        table = HashTable()
+        expected = {}
+        sizes = set()
+        saw_tombstones = compacted = False
+        for step in range(20000):
+            key = str(rng.randrange(3000)) if rng.random() < 0.9 else rng.randrange(-50, 50)
+            action = rng.random()
+            if action < 0.5:
+                table.insert(key, step)
+                expected[key] = step
+            elif action < 0.85:
+                entries = len(table._keys)
+                table.delete(key)
+                expected.pop(key, None)
+                compacted |= len(table._keys) < entries - 1
+            else:
+                self.assertEqual(key in table, key in expected)
+                self.assertEqual(table.get(key, "missing"), expected.get(key, "missing"))
+            saw_tombstones |= table.filled > table.used
+            sizes.add(table.size)
+            if step % 2000 == 0:
+                self.check(table, expected)
+        self.check(table, expected)
+        self.assertGreater(len(sizes), 3)  # grew through several resizes
+        self.assertTrue(saw_tombstones)
+        self.assertTrue(compacted)
+
+    def test_delete_everything_then_reuse(self):
+        table = HashTable()
+        for key in range(1000):
+            table.insert(key, key)
+        for key in range(1000):
+            table.delete(key)
+        self.check(table, {})
+        self.assertLess(len(table._keys), 100)
+        table.insert(5, "five")
+        self.check(table, {5: "five"})
+
+    def test_colliding_keys_probe_past_tombstones(self):
+        table = HashTable()
+        keys = [Colliding(value) for value in range(20)]
+        for key in keys:
+            table.insert(key, key.value)
+        for key in keys[::2]:
+            table.delete(key)
+        for key in keys[1::2]:
+            self.assertEqual(table.get(Colliding(key.value)), key.value)
+        self.assertNotIn(Colliding(0), table)
+        table.insert(Colliding(0), "again")
+        self.assertEqual(table.get(Colliding(0)), "again")
+        self.assertEqual(len(table), 11)
+
+    def test_sized_table_does_not_resize(self):
+        table = HashTable(1000)
+        size = table.size
+        for key in range(1000):
+            table.insert(key, key)
+        self.assertEqual(table.size, size)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,41 @@
+import math
+import random
+import unittest
+from array import array
+
+from wgups.distance_matrix import DistanceMatrix
+from wgups.routing import find_nearest_neighbor_route_and_distances, improve_route, route_distance, route_legs
+
+
+def point_matrix(points):
+    values = array('d', [math.dist(point, other) for point in points for other in points])
+    return DistanceMatrix(len(points), memoryview(values))
+
+
+class ImproveRouteTest(unittest.TestCase):
+    def test_random_routes(self):
+        for seed in range(40):
+            rng = random.Random(seed)
+            matrix = point_matrix([(rng.uniform(0, 30), rng.uniform(0, 30)) for _ in range(rng.randrange(2, 80))])
+            stops = rng.sample(range(1, len(matrix)), rng.randrange(0, len(matrix)))
+            route, legs = find_nearest_neighbor_route_and_distances(matrix, stops)
+            improved, improved_legs, before, after = improve_route(matrix, route, time_budget=5.0)
+            with self.subTest(seed=seed):
+                self.assertEqual(improved[0], 0)
+                self.assertEqual(sorted(improved), sorted(route))
+                self.assertAlmostEqual(before, route_distance(matrix, route))
+                self.assertAlmostEqual(after, route_distance(matrix, improved))
+                self.assertLessEqual(after, before + 1e-9)
+                self.assertEqual(improved_legs, route_legs(matrix, improved))
+
+    def test_crossed_tour_is_uncrossed(self):
+        # Corners of a unit square visited across both diagonals; 2-opt drives the perimeter instead
+        matrix = point_matrix([(0, 0), (0, 1), (1, 1), (1, 0)])
+        improved, legs, before, after = improve_route(matrix, [0, 2, 1, 3])
+        self.assertAlmostEqual(before, 2 + 2 * math.sqrt(2))
+        self.assertAlmostEqual(after, 4)
+        self.assertIn(improved, ([0, 1, 2, 3], [0, 3, 2, 1]))
+
+
+if __name__ == "__main__":
+    unittest.main()
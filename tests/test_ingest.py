@@ -0,0 +1,37 @@
+import unittest
+
+from wgups.ingest import CORRECT, parse_delta_row, parse_delta_time
+from wgups.simulation import Simulation
+
+
+class DeltaTimeTest(unittest.TestCase):
+    def test_twelve_and_twenty_four_hour_times(self):
+        self.assertEqual(parse_delta_time("10:20 AM"), 620)
+        self.assertEqual(parse_delta_time("2:00 pm"), 840)
+        self.assertEqual(parse_delta_time("10:20"), 620)
+        self.assertEqual(parse_delta_time(" 14:00 "), 840)
+        self.assertIsNone(parse_delta_time(""))
+
+    def test_bad_time_is_rejected(self):
+        for text in ("soon", "25:00", "10:75", "1020"):
+            with self.assertRaises(ValueError):
+                parse_delta_time(text)
+        with self.assertRaises(ValueError):
+            parse_delta_row(["later", "correct", "9", "410 S State St"])
+
+    def test_row(self):
+        delta = parse_delta_row(["14:00", "Correct", "9", "410 S State St", "", "", "84111"])
+        self.assertEqual((delta.action, delta.package_id, delta.time), (CORRECT, "9", 840))
+        self.assertEqual(delta.fields, {'address': "410 S State St", 'zip_code': "84111"})
+
+
+class IngestAfterRunTest(unittest.TestCase):
+    def test_ingest_after_the_day_raises(self):
+        simulation = Simulation()
+        simulation.run()
+        with self.assertRaises(RuntimeError):
+            simulation.ingest([parse_delta_row(["14:00", "remove", "40"])])
+
+
+if __name__ == "__main__":
+    unittest.main()
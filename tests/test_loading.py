@@ -0,0 +1,67 @@
+import unittest
+
+from wgups.loading import END_OF_DAY, _ship_with_groups, assign_packages_to_trucks, parse_package_constraints
+from wgups.package import create_package_from_csv_row
+from wgups.simulation import Simulation
+
+
+def package(package_id, notes="", deadline="EOD", address="233 Canyon Rd"):
+    return create_package_from_csv_row([package_id, address, "Salt Lake City", "UT", "84103", deadline, "2", notes])
+
+
+class BundledNotesTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.packages = [package for package_id, package in Simulation().packages_table]
+        cls.constraints = {package.package_id: parse_package_constraints(package) for package in cls.packages}
+
+    def test_notes(self):
+        self.assertEqual(self.constraints['3'].required_truck, 2)
+        self.assertEqual(self.constraints['6'].available_at, 9 * 60 + 5)
+        self.assertEqual(self.constraints['6'].deadline, 10 * 60 + 30)
+        self.assertTrue(self.constraints['9'].address_hold)
+        self.assertEqual(self.constraints['14'].ship_with, ('15', '19'))
+        self.assertEqual(self.constraints['2'].deadline, END_OF_DAY)
+        plain = self.constraints['2']
+        self.assertEqual((plain.available_at, plain.required_truck, plain.ship_with, plain.address_hold),
+                         (None, None, (), False))
+
+    def test_ship_with_notes_merge_into_one_group(self):
+        groups = [sorted(group, key=int) for group in _ship_with_groups(self.constraints)]
+        self.assertIn(['13', '14', '15', '16', '19', '20'], groups)
+        self.assertEqual(sum(len(group) for group in groups), len(self.packages))
+
+    def test_group_rides_one_trip(self):
+        trips, unassigned = assign_packages_to_trucks(self.packages, address_correction_time=10 * 60 + 20)
+        self.assertEqual(unassigned, [])
+        group_trips = {trip for trip in trips for package in trip.packages
+                       if package.package_id in ('13', '14', '15', '16', '19', '20')}
+        self.assertEqual(len(group_trips), 1)
+        self.assertEqual({trip.truck_number for trip in trips for package in trip.packages
+                          if package.package_id in ('3', '18', '36', '38')}, {2})
+
+
+class OverflowTest(unittest.TestCase):
+    def test_packages_beyond_capacity_go_out_on_extra_trips(self):
+        packages = [package(str(package_id)) for package_id in range(1, 6)]
+        trips, unassigned = assign_packages_to_trucks(packages, truck_numbers=(1,), capacity=2)
+        self.assertEqual(unassigned, [])
+        self.assertEqual([len(trip.packages) for trip in trips], [2, 2, 1])
+        self.assertEqual({trip.departure for trip in trips}, {8 * 60})
+        self.assertEqual(sorted(package.package_id for trip in trips for package in trip.packages),
+                         ['1', '2', '3', '4', '5'])
+
+    def test_group_larger_than_a_truck_is_unassigned(self):
+        packages = [package('1', "Must be delivered with 2, 3"), package('2'), package('3')]
+        trips, unassigned = assign_packages_to_trucks(packages, truck_numbers=(1, 2), capacity=2)
+        self.assertEqual(sorted(package.package_id for package in unassigned), ['1', '2', '3'])
+
+    def test_unknown_truck_is_unassigned(self):
+        packages = [package('1', "Can only be on truck 3"), package('2')]
+        trips, unassigned = assign_packages_to_trucks(packages, truck_numbers=(1, 2))
+        self.assertEqual([package.package_id for package in unassigned], ['1'])
+        self.assertEqual([package.package_id for trip in trips for package in trip.packages], ['2'])
+
+
+if __name__ == "__main__":
+    unittest.main()
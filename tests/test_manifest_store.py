@@ -0,0 +1,61 @@
+import math
+import os
+import tempfile
+import unittest
+
+from wgups.manifest_store import ManifestStore
+from wgups.package import create_package_from_csv_row
+from wgups.simulation import Simulation
+
+ROWS = [["PKG-A1", "195 W Oakland Ave", "Salt Lake City", "UT", "84115", "10:30 AM", "21", ""],
+        ["PKG-B2", "2530 S 500 E", "Salt Lake City", "UT", "84106", "EOD", "44", ""],
+        ["PKG-C3", "233 Canyon Rd", "Salt Lake City", "UT", "84103", "EOD", "2", ""]]
+
+
+class ManifestStoreTest(unittest.TestCase):
+    def setUp(self):
+        self.packages = [create_package_from_csv_row(row) for row in ROWS]
+        self.store = ManifestStore.from_packages((package.package_id, package) for package in self.packages)
+
+    def test_non_numeric_ids(self):
+        self.assertEqual(len(self.store), 3)
+        self.assertEqual(self.store.select(status="At Hub"), ["PKG-A1", "PKG-B2", "PKG-C3"])
+
+    def test_truck_numbers_above_one_byte(self):
+        for package, truck in zip(self.packages, (300, 45, 300)):
+            package.status = "In route"
+            package.truck_number = truck
+            self.store.refresh(package)
+        self.assertEqual(self.store.select(truck=300), ["PKG-A1", "PKG-C3"])
+        self.assertEqual(self.store.select(truck=45), ["PKG-B2"])
+        self.assertEqual(self.store.select(truck=300 & 0xFF), [])
+        self.assertEqual(self.store.select_rows(status="In route", truck=300, deadline_by=11 * 60), [0])
+
+    def test_deadline_filter_across_byte_boundaries(self):
+        for package, deadline in zip(self.packages, ("4:15 AM", "4:16 AM", "10:30 AM")):
+            package.delivery_deadline = deadline
+        store = ManifestStore.from_packages((package.package_id, package) for package in self.packages)
+        self.assertEqual(store.select(deadline_by=255), ["PKG-A1"])
+        self.assertEqual(store.select(deadline_by=256), ["PKG-A1", "PKG-B2"])
+        self.assertEqual(store.select(deadline_by=629), ["PKG-A1", "PKG-B2"])
+        self.assertEqual(store.select(deadline_by=630), ["PKG-A1", "PKG-B2", "PKG-C3"])
+        self.assertEqual(store.select(deadline_by=-1), [])
+
+
+class MidDayAddTest(unittest.TestCase):
+    def test_store_after_an_add_without_a_weight(self):
+        simulation = Simulation()
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'deltas.csv')
+            with open(path, 'w', encoding='utf-8') as deltas_file:
+                deltas_file.write("9:30 AM,add,41,233 Canyon Rd,Salt Lake City,UT,84103\n")
+            simulation.ingest_file(path)
+        simulation.run()
+        store = simulation.manifest_store()
+        self.assertEqual(len(store), 41)
+        self.assertTrue(math.isnan(store.weights[store.rows['41']]))
+        self.assertIn('41', store.select(status="Delivered"))
+
+
+if __name__ == "__main__":
+    unittest.main()
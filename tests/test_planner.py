@@ -0,0 +1,41 @@
+import os
+import unittest
+from unittest import mock
+
+from wgups.distance_matrix import load_distance_matrix
+from wgups.planner import RoutePlanner, estimated_work, plan_routes
+from wgups.simulation import DATA_DIR
+
+STOP_SETS = {1: [3, 7, 12, 19, 25], 2: [1, 4, 8, 15, 22, 26], 3: [2, 5, 9]}
+
+
+class RoutePlannerTest(unittest.TestCase):
+    def setUp(self):
+        self.matrix = load_distance_matrix(os.path.join(DATA_DIR, 'WGUPSdistance.csv'))
+
+    def test_small_fleet_is_planned_in_process(self):
+        with RoutePlanner(self.matrix, max_workers=4) as planner:
+            planner.plan(STOP_SETS)
+            self.assertIsNone(planner._executor)
+
+    @mock.patch('wgups.planner.MIN_PARALLEL_WORK', 0)
+    def test_pool_is_kept_between_fleets_and_matches_in_process_plans(self):
+        serial = plan_routes(self.matrix, STOP_SETS, max_workers=1)
+        with RoutePlanner(self.matrix, max_workers=2) as planner:
+            first = planner.plan(STOP_SETS)
+            executor = planner._executor
+            second = planner.plan(STOP_SETS, improve=True)
+            self.assertIs(planner._executor, executor)
+        self.assertIsNone(planner._executor)
+        self.assertIsNone(planner._memory)
+        for truck, plan in serial.items():
+            self.assertEqual(first[truck].route, plan.route)
+            self.assertLessEqual(second[truck].distance_after, plan.distance_after)
+
+    def test_work_counts_improvement(self):
+        self.assertEqual(estimated_work(STOP_SETS), 25 + 36 + 9)
+        self.assertGreater(estimated_work(STOP_SETS, improve=True), estimated_work(STOP_SETS))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,33 @@
+import unittest
+from array import array
+
+from wgups.distance_matrix import DistanceMatrix
+from wgups.routing import find_nearest_neighbor_route_and_distances
+
+# Points on a line at these positions, so several are the same distance apart
+POSITIONS = [0, 2, 2, 4, 1, 5]
+
+
+def line_matrix(positions):
+    size = len(positions)
+    return DistanceMatrix(size, memoryview(array('d', [abs(a - b) for a in positions for b in positions])))
+
+
+class NearestNeighborTest(unittest.TestCase):
+    def test_ties_go_to_the_first_remaining_stop(self):
+        matrix = line_matrix(POSITIONS)
+        self.assertEqual(find_nearest_neighbor_route_and_distances(matrix, [2, 1, 3]), ([0, 2, 1, 3], [2, 0, 2]))
+        self.assertEqual(find_nearest_neighbor_route_and_distances(matrix, [1, 2, 3]), ([0, 1, 2, 3], [2, 0, 2]))
+
+    def test_duplicate_and_start_stops_are_visited_once(self):
+        matrix = line_matrix(POSITIONS)
+        route, legs = find_nearest_neighbor_route_and_distances(matrix, [5, 3, 4, 3, 5, 4], start=4)
+        self.assertEqual(route, [4, 3, 5])
+        self.assertEqual(legs, [3, 1])
+
+    def test_single_stop(self):
+        self.assertEqual(find_nearest_neighbor_route_and_distances(line_matrix(POSITIONS), [5]), ([0, 5], [5]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,26 @@
+import os
+import unittest
+
+from wgups.scenarios import Scenario, ScenarioContext
+from wgups.simulation import DATA_DIR
+
+
+class ScenarioCorrectionsTest(unittest.TestCase):
+    def setUp(self):
+        self.context = ScenarioContext()
+
+    def test_own_manifest_gets_the_data_directory_corrections(self):
+        simulation = self.context.simulation(Scenario("bundled"))
+        simulation.run()
+        self.assertEqual(simulation.packages_table.get('9').address, "410 S State St")
+
+    def test_other_manifest_gets_no_corrections(self):
+        manifest = os.path.join(DATA_DIR, 'WGUPSpackage.csv')
+        simulation = self.context.simulation(Scenario("copy", manifest=manifest))
+        simulation.run()
+        self.assertEqual(simulation.address_corrections, [])
+        self.assertEqual(simulation.packages_table.get('9').address, "300 State St")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from wgups.events import ARRIVE
+from wgups.simulation import DATA_DIR, Simulation
+
+MID_ROUTE_DELTAS = ("8:25 AM,correct,2,233 Canyon Rd,Salt Lake City,UT,84103\n"
+                    "8:25 AM,remove,33\n")
+
+
+class BundledDayTest(unittest.TestCase):
+    def test_bundled_day(self):
+        simulation = Simulation()
+        self.assertAlmostEqual(simulation.run(), 119.7)
+        self.assertEqual(simulation.late_packages(), [])
+        self.assertEqual(simulation.packages_table.get('9').address, "410 S State St")
+
+
+class AddressCorrectionsTest(unittest.TestCase):
+    def test_corrections_belong_to_their_data_directory(self):
+        with tempfile.TemporaryDirectory() as directory:
+            for name in ('WGUPSaddress.csv', 'WGUPSdistance.csv', 'WGUPSpackage.csv'):
+                shutil.copy(os.path.join(DATA_DIR, name), directory)
+            simulation = Simulation(directory)
+            simulation.run()
+        self.assertEqual(simulation.address_corrections, [])
+        self.assertEqual(simulation.packages_table.get('9').address, "300 State St")
+
+
+class MidRouteDeltaTest(unittest.TestCase):
+    def setUp(self):
+        self.simulation = Simulation()
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'deltas.csv')
+            with open(path, 'w', encoding='utf-8') as deltas_file:
+                deltas_file.write(MID_ROUTE_DELTAS)
+            self.simulation.ingest_file(path)
+        self.deliveries = {}  # package ID -> address index it was delivered at
+        self.simulation.add_hook(ARRIVE, lambda event: self.deliveries.update(
+            (package.package_id, event.address) for package in event.packages))
+        self.removed = self.simulation.packages_table.get('33')
+        self.simulation.run()
+
+    def test_corrected_package_is_delivered_at_its_new_address(self):
+        package = self.simulation.packages_table.get('2')
+        self.assertEqual(package.status, "Delivered")
+        self.assertEqual(package.location, self.simulation.address_book.resolve("233 Canyon Rd"))
+        self.assertEqual(self.deliveries['2'], package.location)
+
+    def test_removed_package_is_not_delivered(self):
+        self.assertNotIn('33', self.simulation.packages_table)
+        self.assertNotIn('33', self.deliveries)
+        self.assertNotIn("Delivered", [status for time, status in self.removed.status_tracker])
+
+    def test_truck_counts_end_at_zero(self):
+        self.assertEqual(self.simulation.truck_package_counts, {1: 0, 2: 0})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,18 @@
+# WGUPS routing library: the package hash table, the distance matrix and router, truck loading and planning, and the
+# Simulation that ties them together into a delivery day. Importing it reads no data; see Simulation.
+from wgups.address_book import AddressBook, normalize_address
+from wgups.distance_matrix import DistanceMatrix, load_distance_matrix
+from wgups.events import Event, EventQueue
+from wgups.hash_table import HashTable
+from wgups.ingest import ManifestDelta, read_csv_chunks, read_manifest_deltas
+from wgups.loading import assign_packages_to_trucks
+from wgups.manifest_store import ManifestStore
+from wgups.package import Package, create_package_from_csv_row, package_sort_key
+from wgups.planner import RoutePlanner, plan_routes
+from wgups.profiling import Profiler
+from wgups.report import status_rows, write_report
+from wgups.routing import (find_deadline_route_and_distances, find_nearest_neighbor_route_and_distances,
+                           improve_route, late_stops, rank_stops)
+from wgups.scenarios import Scenario, ScenarioContext, comparison_table, read_scenarios, run_scenarios
+from wgups.simulation import Simulation
+from wgups.status_history import StatusHistory, fleet_status_at
@@ -0,0 +1,149 @@
+import re
+
+from wgups.ingest import read_csv_chunks
+
+# Spelled out directions and street types, mapped to the abbreviations WGUPSaddress.csv uses, so "5100 South 2700
+# West" and "5100 S 2700 W" share one key
+_ABBREVIATIONS = {
+    "north": "n", "south": "s", "east": "e", "west": "w",
+    "northeast": "ne", "northwest": "nw", "southeast": "se", "southwest": "sw",
+    "street": "st", "avenue": "ave", "av": "ave", "road": "rd", "boulevard": "blvd", "drive": "dr", "lane": "ln",
+    "court": "ct", "circle": "cir", "parkway": "pkwy", "place": "pl", "highway": "hwy", "terrace": "ter",
+    "suite": "ste", "apartment": "apt", "unit": "apt",
+}
+_PUNCTUATION = re.compile(r"[^\w\s]")
+# Smallest trigram similarity (Dice coefficient) a fuzzy match needs
+FUZZY_THRESHOLD = 0.7
+
+
+# The canonical form of an address: lower case, punctuation dropped ("#104" becomes "104"), whitespace collapsed and
+# directions and street types abbreviated.
+# BIG O: O(l) for an address of length l
+# Space Complexity: O(l)
+def normalize_address(address):
+    words = _PUNCTUATION.sub(" ", address.lower()).split()
+    return " ".join(_ABBREVIATIONS.get(word, word) for word in words)
+
+
+# The set of three character pieces of a canonical address, padded so the first and last letters count as well.
+# BIG O: O(l)
+# Space Complexity: O(l)
+def _trigrams(key):
+    padded = f"  {key} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+# A Class containing each data object in the WGUPSaddress.csv file. Also contains a counter given to each address
+# and a lookup function passing in the address and returning the associated counter. Every address is also indexed
+# under its normalize_address key, computed once as it is added, so spacing, case and "South" / "S" differences
+# still find it with one dict lookup. resolve adds a trigram fuzzy match for whatever is left, and remembers every
+# address it fuzzy matched or could not place for fuzzy_report.
+# BIG O: O(1)
+# Space Complexity: O(n)
+class AddressBook:
+    def __init__(self):
+        self.address_dict = {}
+        self.counter = 0
+        self.canonical_dict = {}
+        self.fuzzy_matches = {}  # address -> (index, matched address, score)
+        self.unresolved = {}  # address -> (closest address or None, score)
+        self._addresses = []
+        self._keys = []  # canonical key of each address, by index
+        self._trigram_index = None  # trigram -> address indices, built on the first fuzzy lookup
+        self._house_index = {}  # house number -> address indices, built with it
+        self._trigram_sets = []
+
+    def add_address(self, address):
+        numeric_value = self.counter
+        key = normalize_address(address)
+        self.address_dict[address] = numeric_value
+        self.canonical_dict.setdefault(key, numeric_value)
+        self._addresses.append(address)
+        self._keys.append(key)
+        self._trigram_index = None
+        self.counter += 1
+
+    def address_lookup(self, address):
+        index = self.address_dict.get(address)
+        if index is None:
+            index = self.canonical_dict.get(normalize_address(address))
+        return index
+
+    # The index of address, trying an exact match, then its canonical key, then the closest address by trigram
+    # similarity. A fuzzy match must reach FUZZY_THRESHOLD and keep the same house number, so "410 S State St" can
+    # never land on "401 S State St". Returns None when nothing is close enough.
+    # BIG O: O(1) for exact and canonical matches, O(p) for a fuzzy one where p is the number of addresses sharing
+    # a trigram with it
+    # Space Complexity: O(1)
+    def resolve(self, address):
+        index = self.address_lookup(address)
+        if index is not None:
+            return index
+        if address in self.fuzzy_matches:
+            return self.fuzzy_matches[address][0]
+        if address in self.unresolved:
+            return None
+        index, score = self._closest(normalize_address(address))
+        if index is not None and score >= FUZZY_THRESHOLD:
+            self.fuzzy_matches[address] = (index, self._addresses[index], score)
+            return index
+        self.unresolved[address] = (None if index is None else self._addresses[index], score)
+        return None
+
+    # The address whose canonical key shares the most trigrams with key (by Dice coefficient) and has the same
+    # house number, and its score. Only the addresses with that house number are scored; a key without one is
+    # scored against every address sharing a trigram with it. Returns (None, 0.0) when no address qualifies.
+    # BIG O: O(h) for h addresses with the house number, O(p) without one
+    # Space Complexity: O(p)
+    def _closest(self, key):
+        if self._trigram_index is None:
+            self._build_fuzzy_index()
+        query = _trigrams(key)
+        house_number = key.split(" ", 1)[0]
+        if house_number.isdigit():
+            shared = {index: len(query & self._trigram_sets[index])
+                      for index in self._house_index.get(house_number, ())}
+        else:
+            shared = {}
+            for trigram in query:
+                for index in self._trigram_index.get(trigram, ()):
+                    shared[index] = shared.get(index, 0) + 1
+        best, best_score = None, 0.0
+        for index, count in shared.items():
+            score = 2 * count / (len(query) + len(self._trigram_sets[index]))
+            if score > best_score:
+                best, best_score = index, score
+        return best, best_score
+
+    # BIG O: O(n * l)
+    # Space Complexity: O(n * l)
+    def _build_fuzzy_index(self):
+        self._trigram_index = {}
+        self._house_index = {}
+        self._trigram_sets = []
+        for index, known in enumerate(self._keys):
+            trigrams = _trigrams(known)
+            self._trigram_sets.append(trigrams)
+            for trigram in trigrams:
+                self._trigram_index.setdefault(trigram, []).append(index)
+            self._house_index.setdefault(known.split(" ", 1)[0], []).append(index)
+
+    # Every address resolve had to guess at: (address, matched address, score) for the fuzzy matches, then
+    # (address, closest address or None, score) for the ones left unresolved.
+    # BIG O: O(u)
+    # Space Complexity: O(u)
+    def fuzzy_report(self):
+        return ([(address, matched, score) for address, (index, matched, score) in self.fuzzy_matches.items()],
+                [(address, closest, score) for address, (closest, score) in self.unresolved.items()])
+
+
+# Create an address book from WGUPSaddress.csv, numbering the addresses in file order (the hub is 0)
+# BIG O: O(n)
+# Space Complexity: O(n)
+def load_address_book(csv_path):
+    address_book = AddressBook()
+    for chunk in read_csv_chunks(csv_path):
+        for row in chunk:
+            address = row[0].strip()
+            address_book.add_address(address)
+    return address_book
@@ -0,0 +1,148 @@
+import ast
+import csv
+import mmap
+import os
+import struct
+import sys
+from array import array
+
+_NPY_MAGIC = b'\x93NUMPY\x01\x00'
+_NPY_DESCR = '<f8'
+# The size and modification time in nanoseconds of the CSV a cache was parsed from, stored after the matrix data,
+# where numpy.load ignores it
+_SOURCE_STAMP = struct.Struct('<qq')
+
+
+# A dense, symmetric distance matrix stored as one flat run of float64 values in row-major order. The values are
+# either a freshly parsed array or a read-only memory map over a cached .npy file; both are exposed through the same
+# memoryview so that matrix[i][j] returns a float without copying rows.
+# BIG O: O(1) for a row lookup
+# Space Complexity: O(n^2)
+class DistanceMatrix:
+    def __init__(self, size, values, backing=None):
+        self.size = size
+        self.values = values
+        self._backing = backing  # keeps the mmap (if any) alive for as long as the view is used
+
+    def __len__(self):
+        return self.size
+
+    def __getitem__(self, index):
+        start = index * self.size
+        return self.values[start:start + self.size]
+
+
+# Parses a lower (or upper) triangular distance CSV such as WGUPSdistance.csv into a full symmetric matrix. Blank
+# cells are filled from their mirror, so each distance is parsed once and written to both halves. The file is read
+# twice, row by row: once to count the rows, which gives the matrix size, then to parse each row straight into the
+# matrix, so no more than one row of cells is ever held as strings. A row without blanks is converted in one call and
+# written to its row and, mirrored, its column with two slice assignments.
+# BIG O: O(n^2)
+# Space Complexity: O(n^2) for the matrix, plus O(n) for one row
+def parse_distance_csv(csv_path):
+    with open(csv_path, 'r', newline='') as file:
+        size = sum(1 for _ in csv.reader(file))
+        file.seek(0)
+        values = array('d', [0.0]) * (size * size)
+        for i, row in enumerate(csv.reader(file)):
+            cells = row[:size]
+            try:
+                distances = array('d', map(float, cells))
+            except ValueError:
+                # Blank cells keep whatever their mirror wrote
+                for j, cell in enumerate(cells):
+                    if cell.strip():
+                        distance = float(cell)
+                        values[i * size + j] = distance
+                        values[j * size + i] = distance
+                continue
+            values[i * size:i * size + len(distances)] = distances
+            values[i:i + len(distances) * size:size] = distances
+    return size, values
+
+
+def _npy_header(size):
+    header = "{'descr': '%s', 'fortran_order': False, 'shape': (%d, %d), }" % (_NPY_DESCR, size, size)
+    # The magic string, version and length prefix take 10 bytes and the whole header must be padded to 64
+    header += ' ' * (63 - (10 + len(header)) % 64) + '\n'
+    return _NPY_MAGIC + struct.pack('<H', len(header)) + header.encode('latin1')
+
+
+# The (size, modification time in nanoseconds) a cache of path is checked against.
+# BIG O: O(1)
+# Space Complexity: O(1)
+def source_stamp(path):
+    stat = os.stat(path)
+    return stat.st_size, stat.st_mtime_ns
+
+
+# Writes the matrix as a version 1.0 .npy file so it can be memory mapped here or opened with numpy.load, followed by
+# the source_stamp of the file it was parsed from, if given. The file is written beside its final name and swapped in
+# so a concurrent reader never sees a partial cache.
+# BIG O: O(n^2)
+# Space Complexity: O(1) extra (O(n^2) on big endian hosts, which need a byte swapped copy)
+def save_npy(npy_path, size, values, stamp=None):
+    if sys.byteorder != 'little':
+        values = array('d', values)
+        values.byteswap()
+    temp_path = f'{npy_path}.{os.getpid()}.tmp'
+    with open(temp_path, 'wb') as file:
+        file.write(_npy_header(size))
+        file.write(memoryview(values).cast('B'))
+        if stamp is not None:
+            file.write(_SOURCE_STAMP.pack(*stamp))
+    os.replace(temp_path, npy_path)
+
+
+# Memory maps a square float64 .npy file written by save_npy. Returns None when the file is not in that layout, or
+# when stamp is given and the file does not end with that exact source_stamp.
+# BIG O: O(1) (pages are read lazily by the OS)
+# Space Complexity: O(1)
+def load_npy(npy_path, stamp=None):
+    with open(npy_path, 'rb') as file:
+        if file.read(len(_NPY_MAGIC)) != _NPY_MAGIC:
+            return None
+        header_length = struct.unpack('<H', file.read(2))[0]
+        header = ast.literal_eval(file.read(header_length).decode('latin1'))
+        offset = len(_NPY_MAGIC) + 2 + header_length
+        size = header['shape'][0]
+        if header['descr'] != _NPY_DESCR or header['fortran_order'] or header['shape'] != (size, size):
+            return None
+        if stamp is not None:
+            file.seek(offset + 8 * size * size)
+            if file.read() != _SOURCE_STAMP.pack(*stamp):
+                return None
+        if size == 0:
+            return DistanceMatrix(0, memoryview(array('d')))
+        if sys.byteorder != 'little':
+            file.seek(offset)
+            values = array('d')
+            values.fromfile(file, size * size)
+            values.byteswap()
+            return DistanceMatrix(size, memoryview(values))
+        mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    values = memoryview(mapped)[offset:offset + 8 * size * size].cast('d')
+    return DistanceMatrix(size, values, mapped)
+
+
+# Loads the distance matrix for a CSV, reusing a cached .npy beside it when the cache was parsed from a CSV of exactly
+# the same size and modification time. Any difference, even a CSV with an older timestamp than its cache, means the
+# CSV is parsed again and the cache refreshed; a cache that cannot be written (read only checkout) is simply skipped.
+# BIG O: O(1) with a fresh cache, O(n^2) otherwise
+# Space Complexity: O(n^2)
+def load_distance_matrix(csv_path, cache_path=None):
+    if cache_path is None:
+        cache_path = os.path.splitext(csv_path)[0] + '.npy'
+    stamp = source_stamp(csv_path)
+    try:
+        matrix = load_npy(cache_path, stamp)
+        if matrix is not None:
+            return matrix
+    except (OSError, ValueError, SyntaxError, LookupError, TypeError, struct.error):
+        pass
+    size, values = parse_distance_csv(csv_path)
+    try:
+        save_npy(cache_path, size, values, stamp)
+    except OSError:
+        pass
+    return DistanceMatrix(size, memoryview(values))
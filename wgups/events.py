@@ -0,0 +1,103 @@
+import heapq
+from itertools import count
+
+# Event kinds, in the order events at the same moment are handled: manifest changes and packages reaching the hub
+# first, then deliveries, then trucks getting back, and departures last so they see everything that happened at
+# their departure time.
+DELTA = "delta"
+AVAILABLE = "available"
+ARRIVE = "arrive"
+RETURN = "return"
+DEPART = "depart"
+EVENT_KINDS = (DELTA, AVAILABLE, ARRIVE, RETURN, DEPART)
+_PRIORITY = {kind: priority for priority, kind in enumerate(EVENT_KINDS)}
+
+
+# Something that happens at one moment of the day. time is minutes since midnight. truck and address (an address
+# book index) are set for truck events, packages holds the packages the event moved (delivered at an arrival,
+# available at the hub, loaded at a departure), and data carries what the handler needs: the Trip of a departure,
+# the ManifestDelta of a delta, or the route number of an arrival or return.
+# BIG O: O(1)
+# Space Complexity: O(1)
+class Event:
+    __slots__ = ('time', 'kind', 'truck', 'address', 'packages', 'data')
+
+    def __init__(self, time, kind, truck=None, address=None, packages=(), data=None):
+        self.time = time
+        self.kind = kind
+        self.truck = truck
+        self.address = address
+        self.packages = packages
+        self.data = data
+
+
+# The simulation clock: a heapq of events ordered by time, then kind (see EVENT_KINDS), then the order they were
+# scheduled in. now is the time of the event being handled, None until run starts. Hooks registered with add_hook
+# are called with every event of their kind once it is handled, so metrics can be gathered without touching the
+# simulation itself; a kind with no hooks costs nothing.
+# BIG O: O(log e) to schedule or pop with e events queued
+# Space Complexity: O(e)
+class EventQueue:
+    def __init__(self):
+        self.heap = []
+        self.sequence = count()
+        self.hooks = {}
+        self.now = None
+        self.handled = 0
+
+    def __len__(self):
+        return len(self.heap)
+
+    # Queues an event and returns it.
+    # BIG O: O(log e)
+    # Space Complexity: O(1)
+    def schedule(self, time, kind, truck=None, address=None, packages=(), data=None):
+        event = Event(time, kind, truck, address, packages, data)
+        heapq.heappush(self.heap, (time, _PRIORITY[kind], next(self.sequence), event))
+        return event
+
+    # BIG O: O(log e)
+    # Space Complexity: O(1)
+    def pop(self):
+        event = heapq.heappop(self.heap)[3]
+        self.now = event.time
+        return event
+
+    # The next event without removing it, or None when the queue is empty
+    # BIG O: O(1)
+    # Space Complexity: O(1)
+    def peek(self):
+        return self.heap[0][3] if self.heap else None
+
+    # Calls callback(event) after each event of kind is handled.
+    # BIG O: O(1)
+    # Space Complexity: O(1)
+    def add_hook(self, kind, callback):
+        if kind not in _PRIORITY:
+            raise ValueError(f"Unknown event kind {kind!r}; expected one of {', '.join(EVENT_KINDS)}")
+        self.hooks.setdefault(kind, []).append(callback)
+
+    # Counts an event a handler consumed itself with pop, and calls its hooks.
+    # BIG O: O(k) for k hooks
+    # Space Complexity: O(1)
+    def notify(self, event):
+        self.handled += 1
+        for callback in self.hooks.get(event.kind, ()):
+            callback(event)
+
+    # Pops events in order and passes each one to handlers[event.kind], then to its hooks, until the queue is empty.
+    # Handlers may schedule more events as they go, and return False for an event that turned out to be stale (such
+    # as an arrival on a route that was since replanned), which then is neither counted nor passed to the hooks.
+    # BIG O: O(e log e)
+    # Space Complexity: O(e)
+    def run(self, handlers):
+        heap = self.heap
+        hooks = self.hooks
+        while heap:
+            event = heapq.heappop(heap)[3]
+            self.now = event.time
+            if handlers[event.kind](event) is False:
+                continue
+            self.handled += 1
+            for callback in hooks.get(event.kind, ()):
+                callback(event)
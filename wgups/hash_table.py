@@ -0,0 +1,201 @@
+from array import array
+
+# Markers stored in the index array. Any value >= 0 is a position in the dense entry arrays.
+_EMPTY = -1
+_DELETED = -2
+# Placeholder left in the key array where an entry was deleted, until the next compaction.
+_DUMMY = object()
+
+_PERTURB_SHIFT = 5
+_MIN_SIZE = 8
+
+
+# A HashTable class made from scratch to hold package data. Contains an insert, lookup, and delete function.
+# Entries are stored compactly in insertion order across parallel arrays (hashes, keys, values) and a separate
+# open addressing index array maps probe slots to entry positions. Deleted slots are left as tombstones so that
+# probe chains stay intact, and the table resizes itself once live entries plus tombstones pass the load factor.
+# BIG O: O(1) amortized for insert, lookup, delete, len and contains. O(n) for a resize.
+# Space Complexity: O(n)
+class HashTable:
+    def __init__(self, size=_MIN_SIZE, load_factor=2 / 3):
+        self.load_factor = load_factor
+        self.size = _MIN_SIZE
+        # Grow the slot count so that the requested number of keys fits without a resize
+        while self.size * load_factor < size:
+            self.size <<= 1
+        self.table = array('q', [_EMPTY]) * self.size
+        self._hashes = array('q')
+        self._keys = []
+        self._values = []
+        self.used = 0  # live entries
+        self.filled = 0  # live entries plus tombstones
+        self._sorted = None  # (sort key, entry positions) from sorted_items, dropped whenever positions change
+
+    def __iter__(self):
+        # Iterate through each live item in insertion order
+        for key, value in zip(self._keys, self._values):
+            if key is not _DUMMY:
+                yield key, value
+
+    def __len__(self):
+        return self.used
+
+    def __contains__(self, key):
+        return self._find_slot(key, hash(key))[1] >= 0
+
+    # Walks the probe sequence for a key. Returns the slot index along with the entry position stored there, or
+    # the slot the key should be written to (first tombstone seen, else the empty slot) with position -1.
+    # BIG O: O(1) average
+    # Space Complexity: O(1)
+    def _find_slot(self, key, key_hash):
+        table = self.table
+        mask = self.size - 1
+        index = key_hash & mask
+        position = table[index]
+        if position >= 0 and self._keys[position] is key:
+            # Fast path for the common case of a hit on the first probe with the same key object
+            return index, position
+        hashes = self._hashes
+        keys = self._keys
+        perturb = key_hash & 0xFFFFFFFFFFFFFFFF
+        free_slot = -1
+        while True:
+            if position == _EMPTY:
+                return (index if free_slot < 0 else free_slot), -1
+            if position == _DELETED:
+                if free_slot < 0:
+                    free_slot = index
+            elif hashes[position] == key_hash and keys[position] == key:
+                return index, position
+            perturb >>= _PERTURB_SHIFT
+            index = (index * 5 + perturb + 1) & mask
+            position = table[index]
+
+    # The number of slots _find_slot visits for a key before it finds it or an empty slot, for profiling.
+    # BIG O: O(1) average
+    # Space Complexity: O(1)
+    def probe_count(self, key, key_hash):
+        mask = self.size - 1
+        index = key_hash & mask
+        perturb = key_hash & 0xFFFFFFFFFFFFFFFF
+        probes = 1
+        while True:
+            position = self.table[index]
+            if position == _EMPTY or (position >= 0 and self._hashes[position] == key_hash
+                                      and self._keys[position] == key):
+                return probes
+            perturb >>= _PERTURB_SHIFT
+            index = (index * 5 + perturb + 1) & mask
+            probes += 1
+
+    # Rebuilds the index for a new slot count and compacts the entry arrays, dropping deleted entries.
+    # BIG O: O(n)
+    # Space Complexity: O(n)
+    def _resize(self, new_size):
+        live = [(h, k, v) for h, k, v in zip(self._hashes, self._keys, self._values) if k is not _DUMMY]
+        self._sorted = None
+        self.size = new_size
+        self.table = array('q', [_EMPTY]) * new_size
+        self._hashes = array('q', [h for h, _, _ in live])
+        self._keys = [k for _, k, _ in live]
+        self._values = [v for _, _, v in live]
+        mask = new_size - 1
+        for position, key_hash in enumerate(self._hashes):
+            perturb = key_hash & 0xFFFFFFFFFFFFFFFF
+            index = key_hash & mask
+            while self.table[index] != _EMPTY:
+                perturb >>= _PERTURB_SHIFT
+                index = (index * 5 + perturb + 1) & mask
+            self.table[index] = position
+        self.filled = self.used
+
+    def insert(self, key, value):
+        key_hash = hash(key)
+        index, position = self._find_slot(key, key_hash)
+        if position >= 0:
+            self._values[position] = value
+            return
+        if self.table[index] == _EMPTY:
+            self.filled += 1
+        self.table[index] = len(self._keys)
+        self._sorted = None
+        self._hashes.append(key_hash)
+        self._keys.append(key)
+        self._values.append(value)
+        self.used += 1
+        if self.filled > self.size * self.load_factor:
+            # Double when mostly live entries, otherwise rebuild at the same size to clear out tombstones
+            self._resize(self.size * 2 if self.used * 2 > self.size * self.load_factor else self.size)
+
+    # Returns the stored value itself rather than the package summary built by lookup.
+    # BIG O: O(1) average
+    # Space Complexity: O(1)
+    def get(self, key, default=None):
+        position = self._find_slot(key, hash(key))[1]
+        return self._values[position] if position >= 0 else default
+
+    # The stored value of every key in keys, in the same order, with default for missing keys. One pass with the
+    # probe loop's lookups bound once, for reports over the whole table.
+    # BIG O: O(k) average for k keys
+    # Space Complexity: O(k)
+    def get_many(self, keys, default=None):
+        find_slot = self._find_slot
+        values = self._values
+        found = []
+        for key in keys:
+            position = find_slot(key, hash(key))[1]
+            found.append(values[position] if position >= 0 else default)
+        return found
+
+    def lookup(self, key):
+        return _summary(self.get(key))
+
+    # lookup for every key in keys, in one pass: the package summary of each, or None for a missing key.
+    # BIG O: O(k) average
+    # Space Complexity: O(k)
+    def lookup_many(self, keys):
+        return [_summary(package) for package in self.get_many(keys)]
+
+    # A snapshot of the table as (key, value) pairs sorted by key (by sort_key(key) when given), read straight out of
+    # the entry arrays with no hashing. The sorted entry positions are kept until a key is added or removed or the
+    # table compacts, so reports over an unchanged table neither sort nor probe again; pass the same sort_key
+    # function each time.
+    # BIG O: O(n) while the keys are unchanged, O(n log n) otherwise
+    # Space Complexity: O(n)
+    def sorted_items(self, sort_key=None):
+        keys = self._keys
+        values = self._values
+        if self._sorted is None or self._sorted[0] is not sort_key:
+            positions = [position for position, key in enumerate(keys) if key is not _DUMMY]
+            positions.sort(key=keys.__getitem__ if sort_key is None else lambda position: sort_key(keys[position]))
+            self._sorted = (sort_key, positions)
+        return [(keys[position], values[position]) for position in self._sorted[1]]
+
+    def delete(self, key):
+        index, position = self._find_slot(key, hash(key))
+        if position >= 0:
+            self.table[index] = _DELETED
+            self._keys[position] = _DUMMY
+            self._values[position] = None
+            self.used -= 1
+            self._sorted = None
+            # Compact once more than half of the entry arrays are dead weight
+            if len(self._keys) > 2 * self.used + _MIN_SIZE:
+                self._resize(self.size)
+
+
+# The summary lookup returns for a stored package, or None when there is no package.
+# BIG O: O(1)
+# Space Complexity: O(1)
+def _summary(package):
+    if package is None:
+        return None
+    return {
+        'address': package.address,
+        'deadline': package.delivery_deadline,
+        'city': package.city,
+        'zip_code': package.zip_code,
+        'weight': package.weight,
+        'status': package.status,
+        'delivery_time': package.timestamp,
+    }
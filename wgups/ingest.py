@@ -0,0 +1,95 @@
+import csv
+import re
+from itertools import islice
+
+from wgups.loading import parse_clock_minutes
+
+CHUNK_SIZE = 1000
+ADD = "add"
+REMOVE = "remove"
+CORRECT = "correct"
+ACTIONS = (ADD, REMOVE, CORRECT)
+# The columns of WGUPSpackage.csv, which a delta row repeats after its time and action
+PACKAGE_FIELDS = ('package_id', 'address', 'city', 'state', 'zip_code', 'delivery_deadline', 'weight',
+                  'package_special_notes')
+_CLOCK_24 = re.compile(r'(\d{1,2}):(\d{2})')
+
+
+# Reads a CSV file a chunk of rows at a time, so a large manifest is never held in memory as a whole. Blank lines
+# are skipped.
+# BIG O: O(n) over the whole file
+# Space Complexity: O(chunk_size)
+def read_csv_chunks(csv_path, chunk_size=CHUNK_SIZE):
+    with open(csv_path, 'r', encoding='utf-8', newline='') as csv_file:
+        csv_reader = csv.reader(csv_file, delimiter=',')
+        while True:
+            chunk = [row for row in islice(csv_reader, chunk_size) if row]
+            if not chunk:
+                return
+            yield chunk
+
+
+# One change to the manifest: add a package, remove one, or correct some of its fields. fields maps the
+# PACKAGE_FIELDS names to their new values; time is minutes since midnight when the change takes effect, or None
+# for as soon as it is received.
+# BIG O: O(1)
+# Space Complexity: O(1)
+class ManifestDelta:
+    def __init__(self, action, package_id, fields=None, time=None):
+        self.action = action
+        self.package_id = package_id
+        self.fields = fields or {}
+        self.time = time
+
+    # The added package as a WGUPSpackage.csv row, with blanks for the fields the delta left out
+    def package_row(self):
+        return [self.package_id] + [self.fields.get(name, '') for name in PACKAGE_FIELDS[1:]]
+
+
+# A delta's time cell as minutes since midnight: a 12 hour clock time such as "10:20 AM" or a 24 hour one such as
+# "14:00". An empty cell is None, for immediately; anything else raises ValueError, so a change meant for later in
+# the day is never applied early by mistake.
+# BIG O: O(1)
+# Space Complexity: O(1)
+def parse_delta_time(text):
+    text = text.strip()
+    if not text:
+        return None
+    minutes = parse_clock_minutes(text)
+    if minutes is None:
+        match = _CLOCK_24.fullmatch(text)
+        if match is not None and int(match.group(1)) < 24 and int(match.group(2)) < 60:
+            minutes = int(match.group(1)) * 60 + int(match.group(2))
+    if minutes is None:
+        raise ValueError(f"Delta time {text!r} is not a clock time such as 10:20 AM or 14:00")
+    return minutes
+
+
+# Parses one delta row: time, action, then the package columns in WGUPSpackage.csv order, for example
+# "10:20 AM,correct,9,410 S State St,Salt Lake City,UT,84111". An empty time means immediately (see
+# parse_delta_time), and only the non-empty columns of a correction are changed. Returns None for a row with an
+# unknown action or no package ID, and raises ValueError for one whose time does not parse.
+# BIG O: O(1)
+# Space Complexity: O(1)
+def parse_delta_row(row):
+    if len(row) < 3:
+        return None
+    action = row[1].strip().lower()
+    package_id = row[2].strip()
+    if action not in ACTIONS or not package_id:
+        return None
+    fields = {name: value.strip() for name, value in zip(PACKAGE_FIELDS[1:], row[3:]) if value.strip()}
+    time = parse_delta_time(row[0])
+    return ManifestDelta(action, package_id, fields, time)
+
+
+# Streams the deltas out of a delta CSV file in file order, reading it a chunk at a time. Rows with an unknown action
+# or no package ID are skipped; a row with a bad time raises ValueError (see parse_delta_row).
+# BIG O: O(n)
+# Space Complexity: O(chunk_size)
+def read_manifest_deltas(csv_path, chunk_size=CHUNK_SIZE):
+    for chunk in read_csv_chunks(csv_path, chunk_size):
+        for row in chunk:
+            delta = parse_delta_row(row)
+            if delta is not None:
+                yield delta
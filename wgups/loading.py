@@ -0,0 +1,320 @@
+import heapq
+import re
+from bisect import bisect_left, insort
+
+TRUCK_CAPACITY = 16
+# Sorts after every real deadline so EOD packages fill whatever room the timed ones leave
+END_OF_DAY = 24 * 60
+
+_CLOCK = re.compile(r'(\d{1,2}):(\d{2})\s*([ap])\.?m', re.IGNORECASE)
+_TRUCK_NOTE = re.compile(r'only be on truck\s*(\d+)', re.IGNORECASE)
+_DELAYED_NOTE = re.compile(r'delayed', re.IGNORECASE)
+_SHIP_WITH_NOTE = re.compile(r'delivered with\s*([\d,\s]+)', re.IGNORECASE)
+_WRONG_ADDRESS_NOTE = re.compile(r'wrong address', re.IGNORECASE)
+
+
+# Converts a clock time such as "10:30 AM" or "9:05 am" into minutes since midnight. Returns None for anything
+# without a clock time in it, such as "EOD".
+# BIG O: O(1)
+# Space Complexity: O(1)
+def parse_clock_minutes(text):
+    match = _CLOCK.search(text)
+    if match is None:
+        return None
+    hour, minute, meridiem = int(match.group(1)), int(match.group(2)), match.group(3).lower()
+    return (hour % 12 + (12 if meridiem == 'p' else 0)) * 60 + minute
+
+
+# The loading rules for one package, parsed out of its delivery deadline and special notes:
+# "Can only be on truck 2", "Delayed on flight---will not arrive to depot until 9:05 am", "Must be delivered with
+# 13, 15" and "Wrong address listed". Times are minutes since midnight.
+# BIG O: O(1)
+# Space Complexity: O(1)
+class PackageConstraints:
+    def __init__(self, package_id, deadline=END_OF_DAY, available_at=None, required_truck=None, ship_with=(),
+                 address_hold=False):
+        self.package_id = package_id
+        self.deadline = deadline
+        self.available_at = available_at
+        self.required_truck = required_truck
+        self.ship_with = ship_with
+        self.address_hold = address_hold
+
+
+# BIG O: O(1)
+# Space Complexity: O(1)
+def parse_package_constraints(package):
+    notes = package.package_special_notes or ''
+    deadline = parse_clock_minutes(package.delivery_deadline)
+    truck_match = _TRUCK_NOTE.search(notes)
+    ship_with_match = _SHIP_WITH_NOTE.search(notes)
+    return PackageConstraints(
+        package.package_id,
+        deadline=END_OF_DAY if deadline is None else deadline,
+        available_at=parse_clock_minutes(notes) if _DELAYED_NOTE.search(notes) else None,
+        required_truck=int(truck_match.group(1)) if truck_match else None,
+        ship_with=tuple(re.findall(r'\d+', ship_with_match.group(1))) if ship_with_match else (),
+        address_hold=_WRONG_ADDRESS_NOTE.search(notes) is not None,
+    )
+
+
+# One departure of a truck from the hub and the packages loaded for it. departure is minutes since midnight.
+# BIG O: O(1)
+# Space Complexity: O(n)
+class Trip:
+    def __init__(self, truck_number, departure):
+        self.truck_number = truck_number
+        self.departure = departure
+        self.packages = []
+
+
+# Packages that must leave together, merged through every "Must be delivered with" note. The group takes the
+# tightest deadline, the latest availability and the truck requirement of its members.
+# BIG O: O(1)
+# Space Complexity: O(n)
+class _LoadGroup:
+    def __init__(self):
+        self.packages = []
+        self.deadline = END_OF_DAY
+        self.available_at = 0
+        self.required_truck = None
+        self.order = END_OF_DAY
+
+
+# The trips that leave at day_start, indexed so a group finds its trip without scanning them all. A heap keeps the
+# least loaded trip on top for groups with a deadline, and for EOD groups each trip is filed under the stop_order
+# ranks of the stops it makes (rank 0, the hub, while it has none), so the closest trip is found by walking outwards
+# from the group's rank over ranks that some trip still stops at. Full trips are dropped from the ranks. Trips are
+# named by their index in the list they were given in.
+# BIG O: O(log t) to find the least loaded trip, O(k log t + m) to find the closest one after walking past k ranks
+# of trips without room, O(m + log t) to update a trip carrying m packages
+# Space Complexity: O(t + m) for t trips carrying m packages
+class _StartTrips:
+    def __init__(self, trips, capacity):
+        self.trips = trips
+        self.capacity = capacity
+        self.loads = [(0, index) for index in range(len(trips))]  # heap of (load, index), stale once a trip loads
+        self.filed = [{0} for _ in trips]  # index -> ranks the trip is filed under
+        self.by_rank = {0: set(range(len(trips)))} if trips else {}
+        self.ranks = sorted(self.by_rank)
+
+    # The least loaded trip, the first one of those on a tie, or None without trips.
+    def least_loaded(self):
+        loads = self.loads
+        while loads and loads[0][0] != len(self.trips[loads[0][1]].packages):
+            heapq.heappop(loads)
+        return loads[0][1] if loads else None
+
+    # The trip with room for size more packages whose closest stop is nearest order (see _order_gap), the last one
+    # of those on a tie, as (gap, index); None if no trip has that much room.
+    def closest(self, order, size):
+        least = self.least_loaded()
+        if least is None or len(self.trips[least].packages) + size > self.capacity:
+            return None
+        ranks = self.ranks
+        right = bisect_left(ranks, order)
+        left = right - 1
+        best = None
+        while left >= 0 or right < len(ranks):
+            left_gap = order - ranks[left] if left >= 0 else None
+            right_gap = ranks[right] - order if right < len(ranks) else None
+            gap = min(gap for gap in (left_gap, right_gap) if gap is not None)
+            if best is not None and gap > best[0]:
+                break
+            for rank_gap, rank in ((left_gap, left), (right_gap, right)):
+                if rank_gap == gap:
+                    for index in self.by_rank[ranks[rank]]:
+                        if len(self.trips[index].packages) + size <= self.capacity and \
+                                (best is None or index > best[1]):
+                            best = (gap, index)
+            if left_gap == gap:
+                left -= 1
+            if right_gap == gap:
+                right += 1
+        return best
+
+    # Refiles trip index after packages were loaded onto it; orders is the sorted stop_order of its groups.
+    def update(self, index, orders):
+        trip = self.trips[index]
+        heapq.heappush(self.loads, (len(trip.packages), index))
+        ranks = set() if len(trip.packages) >= self.capacity else set(orders) or {0}
+        for rank in self.filed[index] - ranks:
+            bucket = self.by_rank[rank]
+            bucket.discard(index)
+            if not bucket:
+                del self.by_rank[rank]
+                del self.ranks[bisect_left(self.ranks, rank)]
+        for rank in ranks - self.filed[index]:
+            if rank not in self.by_rank:
+                self.by_rank[rank] = set()
+                insort(self.ranks, rank)
+            self.by_rank[rank].add(index)
+        self.filed[index] = ranks
+
+
+# Union-find over package IDs linked by ship-with notes. Returns a list of lists of package IDs.
+# BIG O: O(n * α(n))
+# Space Complexity: O(n)
+def _ship_with_groups(constraints):
+    parent = {package_id: package_id for package_id in constraints}
+
+    def find(package_id):
+        while parent[package_id] != package_id:
+            parent[package_id] = parent[parent[package_id]]
+            package_id = parent[package_id]
+        return package_id
+
+    for package_id, constraint in constraints.items():
+        for other_id in constraint.ship_with:
+            if other_id in parent:
+                parent[find(other_id)] = find(package_id)
+    groups = {}
+    for package_id in constraints:
+        groups.setdefault(find(package_id), []).append(package_id)
+    return list(groups.values())
+
+
+# Decides which truck trip carries every package, straight from the manifest instead of hand picked ID lists.
+# Each truck leaves at day_start, and every later time that packages become available (a delayed flight landing,
+# or address_correction_time for packages held on a wrong address) adds a trip for the next truck in turn.
+# Ship-with groups are then placed tightest deadline first, and within a deadline the most constrained first, onto
+# trips that leave no earlier than the group is available, run on an allowed truck, and still have room for the
+# whole group. Groups with a deadline take the earliest such trip, spread over the least loaded truck when several
+# leave together. EOD groups take the trip whose stops sit closest in stop_order (a dict of address -> rank, such as
+# a route through every address), except that a late trip already carrying deadline packages is kept short.
+# Groups that fit none of those trips go out on extra trips once the trucks are back (see _extra_trips). Returns
+# the trips in departure order and the packages that could not be placed. constraints may map package IDs to their
+# already parsed PackageConstraints (see Simulation.constraints_of); packages missing from it are parsed here.
+# The trips leaving at day_start, one per truck, are looked up through _StartTrips rather than scanned, so a group
+# only scans the later trips it could take, one per release time, and the start trips of its own truck.
+# BIG O: O(n log n + n * r) for r release times, plus walking past ranks whose trips lack room (see _StartTrips)
+# Space Complexity: O(n)
+def assign_packages_to_trucks(packages, truck_numbers=(1, 2), day_start=8 * 60, address_correction_time=None,
+                              capacity=TRUCK_CAPACITY, stop_order=None, constraints=None):
+    packages_by_id = {package.package_id: package for package in packages}
+    known = constraints or {}
+    constraints = {package_id: known.get(package_id) or parse_package_constraints(package)
+                   for package_id, package in packages_by_id.items()}
+
+    groups = []
+    for member_ids in _ship_with_groups(constraints):
+        group = _LoadGroup()
+        for package_id in member_ids:
+            constraint = constraints[package_id]
+            package = packages_by_id[package_id]
+            group.packages.append(package)
+            group.deadline = min(group.deadline, constraint.deadline)
+            available_at = constraint.available_at or day_start
+            if constraint.address_hold:
+                available_at = END_OF_DAY if address_correction_time is None else address_correction_time
+            group.available_at = max(group.available_at, available_at)
+            if constraint.required_truck is not None:
+                group.required_truck = constraint.required_truck
+            if stop_order is not None:
+                group.order = min(group.order, stop_order.get(package.address, END_OF_DAY))
+        groups.append(group)
+    # Within a deadline the groups with the fewest trip options go first: held or delayed, then truck restricted
+    groups.sort(key=lambda g: (g.deadline, -g.available_at, g.required_truck is None, g.order))
+
+    trips = [Trip(truck_number, day_start) for truck_number in truck_numbers]
+    release_times = sorted({g.available_at for g in groups if day_start < g.available_at < END_OF_DAY})
+    for turn, release_time in enumerate(release_times):
+        trips.append(Trip(truck_numbers[turn % len(truck_numbers)], release_time))
+
+    leftover = []
+    trip_orders = {trip: [] for trip in trips}
+    timed_trips = set()
+    start_count = len(truck_numbers)
+    start_trips = _StartTrips(trips[:start_count], capacity)
+    start_by_truck = {}
+    for index, trip in enumerate(trips[:start_count]):
+        start_by_truck.setdefault(trip.truck_number, []).append(index)
+    departures = [trip.departure for trip in trips]
+    for group in groups:
+        size = len(group.packages)
+        timed = group.deadline < END_OF_DAY
+        # Candidate trips by index: the best start trip (or the required truck's), then later trips it can take
+        fits = []
+        if group.available_at <= day_start:
+            if group.required_truck is not None:
+                fits = [index for index in start_by_truck.get(group.required_truck, ())
+                        if len(trips[index].packages) + size <= capacity]
+            elif timed:
+                least = start_trips.least_loaded()
+                if least is not None and len(trips[least].packages) + size <= capacity:
+                    fits = [least]
+            else:
+                closest = start_trips.closest(group.order, size)
+                if closest is not None:
+                    fits = [closest[1]]
+        if not (timed and fits):
+            fits += [index for index in range(max(start_count, bisect_left(departures, group.available_at)),
+                                              len(trips))
+                     if group.required_truck in (None, trips[index].truck_number)
+                     and len(trips[index].packages) + size <= capacity]
+        if not fits:
+            leftover.append(group)
+            continue
+        if timed:
+            index = min(fits, key=lambda i: (trips[i].departure, len(trips[i].packages), i))
+            timed_trips.add(trips[index])
+        else:
+            index = min(fits, key=lambda i: (_eod_cost(trip_orders[trips[i]], group.order,
+                                                       trips[i] in timed_trips and trips[i].departure > day_start), -i))
+        trip = trips[index]
+        trip.packages.extend(group.packages)
+        insort(trip_orders[trip], group.order)
+        if index < start_count:
+            start_trips.update(index, trip_orders[trip])
+    extra_trips, unassigned = _extra_trips(leftover, truck_numbers, trips[-1].departure, capacity)
+    return trips + extra_trips, unassigned
+
+
+# Loads the groups that did not fit the regular trips onto extra trips, tightest deadline first and then in
+# stop_order so each trip covers neighbouring stops. Unrestricted groups fill one trip after another, handed to the
+# trucks in turn; truck restricted groups fill trips of their own truck. The extra trips are listed as leaving at
+# departure, the last regular departure, and really leave whenever their truck gets back to the hub. Returns the
+# extra trips and the packages that fit no truck at all.
+# BIG O: O(g log g) for g groups
+# Space Complexity: O(g)
+def _extra_trips(groups, truck_numbers, departure, capacity):
+    extra_trips = []
+    unassigned = []
+    open_trips = {}  # required truck (None for any) -> trip being filled
+    turn = 0
+    allowed_trucks = {None, *truck_numbers}
+    for group in sorted(groups, key=lambda g: (g.deadline, g.order)):
+        if len(group.packages) > capacity or group.required_truck not in allowed_trucks:
+            unassigned.extend(group.packages)
+            continue
+        trip = open_trips.get(group.required_truck)
+        if trip is None or len(trip.packages) + len(group.packages) > capacity:
+            if group.required_truck is None:
+                trip = Trip(truck_numbers[turn % len(truck_numbers)], departure)
+                turn += 1
+            else:
+                trip = Trip(group.required_truck, departure)
+            open_trips[group.required_truck] = trip
+            extra_trips.append(trip)
+        trip.packages.extend(group.packages)
+    return extra_trips, unassigned
+
+
+# Ranks a trip for an EOD group: the closest trip in stop_order wins, but trips that leave after day_start with
+# deadline packages aboard only take EOD packages for stops they already make, so they get back out quickly.
+# BIG O: O(log m)
+# Space Complexity: O(1)
+def _eod_cost(trip_orders, order, keep_short):
+    gap = _order_gap(trip_orders, order)
+    return keep_short and gap > 0, gap
+
+
+# How far order is from the closest stop already on a trip, measured in stop_order ranks. An empty trip measures
+# from the hub, which is rank 0.
+# BIG O: O(log m)
+# Space Complexity: O(1)
+def _order_gap(trip_orders, order):
+    if not trip_orders:
+        return order
+    index = bisect_left(trip_orders, order)
+    return min(abs(trip_orders[i] - order) for i in (index - 1, index) if 0 <= i < len(trip_orders))
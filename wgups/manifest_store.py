@@ -0,0 +1,150 @@
+import math
+import sys
+from array import array
+from itertools import compress
+
+from wgups.loading import END_OF_DAY, parse_clock_minutes
+
+STATUS_CODES = {"At Hub": 0, "In route": 1, "Delivered": 2}
+NO_TRUCK = 0
+NO_ADDRESS = -1
+# Truck numbers are stored in two bytes
+MAX_TRUCK = 0xFFFF
+
+
+# A package's weight as a float, NaN when the cell is blank or not a number (an add delta may leave it out)
+def _weight(value):
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return math.nan
+
+
+# Translation table that turns a byte column into a 0/1 mask for the values first to last, a whole column at a time
+def _range_table(first, last):
+    return bytes(int(first <= code <= last) for code in range(256))
+
+
+def _match_table(value):
+    return _range_table(value, value)
+
+
+# The low and high bytes of every value in a two byte column, as two byte strings in row order
+def _byte_planes(column):
+    column_bytes = column.tobytes()
+    low, high = (0, 1) if sys.byteorder == 'little' else (1, 0)
+    return column_bytes[low::2], column_bytes[high::2]
+
+
+# A columnar copy of the manifest for fleet-wide filters. Each field is one typed array indexed by row: address
+# indices, deadlines as minutes since midnight, weights as floats (NaN when unknown), status codes as one byte and
+# truck numbers as two bytes per package (so trucks up to MAX_TRUCK); rows maps each package ID, whatever its format,
+# to its row, in row order. Every filter becomes bytes.translate calls that turn a column into a 0/1 mask (the two
+# byte columns one byte plane at a time), masks are combined as big integers, and the matching rows come out of
+# itertools.compress, so a query over a large manifest runs in C rather than one attribute lookup per package.
+# BIG O: O(n) to build, O(n) (in C) per filter
+# Space Complexity: O(n): 21 bytes a package in the columns, plus the package ID to row dict
+class ManifestStore:
+    def __init__(self):
+        self.address_indices = array('l')
+        self.deadlines = array('H')
+        self.weights = array('d')
+        self.statuses = bytearray()
+        self.trucks = array('H')
+        self.rows = {}
+
+    def __len__(self):
+        return len(self.rows)
+
+    # Builds the store from (package_id, package) pairs, such as a HashTable. address_book resolves each address to
+    # its index; without one the address column is left as NO_ADDRESS.
+    # BIG O: O(n)
+    # Space Complexity: O(n)
+    @classmethod
+    def from_packages(cls, packages, address_book=None):
+        store = cls()
+        for package_id, package in packages:
+            store.add(package, address_book)
+        return store
+
+    # Appends a package as a new row, or refreshes its row if it is already in the store. The address index is the
+    # package's cached location, or looked up in address_book when it has none.
+    # BIG O: O(1)
+    # Space Complexity: O(1)
+    def add(self, package, address_book=None):
+        if package.package_id in self.rows:
+            self.refresh(package)
+            return
+        address_index = package.location
+        if address_index is None and address_book is not None:
+            address_index = address_book.address_lookup(package.address)
+        deadline = parse_clock_minutes(package.delivery_deadline)
+        self.rows[package.package_id] = len(self.rows)
+        self.address_indices.append(NO_ADDRESS if address_index is None else address_index)
+        self.deadlines.append(END_OF_DAY if deadline is None else deadline)
+        self.weights.append(_weight(package.weight))
+        self.statuses.append(STATUS_CODES.get(package.status, 0))
+        self.trucks.append(package.truck_number if isinstance(package.truck_number, int) else NO_TRUCK)
+
+    # Copies a package's current status and truck into its row after it is loaded or delivered.
+    # BIG O: O(1)
+    # Space Complexity: O(1)
+    def refresh(self, package):
+        row = self.rows[package.package_id]
+        self.statuses[row] = STATUS_CODES.get(package.status, 0)
+        self.trucks[row] = package.truck_number if isinstance(package.truck_number, int) else NO_TRUCK
+
+    # Rows matching every filter given: a status name, a truck number and/or deadlines at or before a time in
+    # minutes since midnight. Returns the row numbers in manifest order.
+    # BIG O: O(n)
+    # Space Complexity: O(n)
+    def select_rows(self, status=None, truck=None, deadline_by=None):
+        return list(compress(range(len(self.rows)), self._mask(status, truck, deadline_by)))
+
+    # Package IDs (as strings, the HashTable keys) matching the filters, e.g. select(status="At Hub", truck=2).
+    # BIG O: O(n)
+    # Space Complexity: O(n)
+    def select(self, status=None, truck=None, deadline_by=None):
+        # rows holds the string IDs in row order, so they can be compressed directly
+        return list(compress(self.rows, self._mask(status, truck, deadline_by)))
+
+    # One byte per row, 1 where the row matches every filter given and 0 elsewhere.
+    # BIG O: O(n)
+    # Space Complexity: O(n)
+    def _mask(self, status, truck, deadline_by):
+        size = len(self.rows)
+        mask = (1 << (8 * size)) - 1 if size else 0
+        if status is not None:
+            mask &= int.from_bytes(self.statuses.translate(_match_table(STATUS_CODES[status])), 'little')
+        if truck is not None:
+            mask &= self._truck_mask(truck)
+        if deadline_by is not None:
+            mask &= self._deadline_mask(deadline_by)
+        return mask.to_bytes(size, 'little')
+
+    # 1 bits for the rows on truck, from one translate over each byte of the truck column.
+    # BIG O: O(n)
+    # Space Complexity: O(n)
+    def _truck_mask(self, truck):
+        if not isinstance(truck, int) or not 0 <= truck <= MAX_TRUCK:
+            return 0
+        low, high = _byte_planes(self.trucks)
+        return (int.from_bytes(low.translate(_match_table(truck & 0xFF)), 'little') &
+                int.from_bytes(high.translate(_match_table(truck >> 8)), 'little'))
+
+    # 1 bits for the rows with a deadline at or before deadline_by: a high byte below the limit's, or the same high
+    # byte and a low byte no greater than the limit's.
+    # BIG O: O(n)
+    # Space Complexity: O(n)
+    def _deadline_mask(self, deadline_by):
+        limit = math.floor(deadline_by)
+        if limit < 0:
+            return 0
+        if limit >= 0xFFFF:
+            return -1  # every row
+        low, high = _byte_planes(self.deadlines)
+        high_limit, low_limit = divmod(limit, 256)
+        earlier = int.from_bytes(high.translate(_range_table(0, high_limit - 1)), 'little')
+        same_high_byte = (int.from_bytes(high.translate(_match_table(high_limit)), 'little') &
+                           int.from_bytes(low.translate(_range_table(0, low_limit)), 'little'))
+        return earlier | same_high_byte
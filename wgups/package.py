@@ -0,0 +1,97 @@
+import sys
+from datetime import datetime
+
+from wgups.hash_table import HashTable
+from wgups.ingest import read_csv_chunks
+from wgups.status_history import StatusHistory
+
+
+# Every package starts the day at the hub at 8:00am; one shared datetime instead of one parsed per row
+DEFAULT_TIMESTAMP = datetime(2023, 10, 24, 8, 0, 0)
+
+
+# A Package class to contain the format for a package data. Including package ID, Address, City, State, ZipCode,
+# Delivery Deadline, Weight, Special Notes, Timestamp, Distance, Status, and a Status Tracker. Packages are held in
+# __slots__ rather than a per-object __dict__, and the fields that repeat across a manifest (city, state, ZIP code
+# and deadline) are interned so every package shares one copy of each distinct string. location caches the address
+# book index the address resolved to (see Simulation.locate), so routing never has to look the address up again.
+# BIG O: O(1)
+# Space Complexity: O(1)
+class Package:
+    __slots__ = ('package_id', 'address', 'city', 'state', 'zip_code', 'delivery_deadline', 'weight',
+                 'package_special_notes', 'timestamp', 'distance', 'status', 'status_tracker', 'truck_number',
+                 'location')
+
+    def __init__(self, package_id, address, city, state, zip_code, delivery_deadline, weight, package_special_notes,
+                 timestamp=None, distance=None, status=None, truck_number=None):
+        self.package_id = package_id
+        self.address = address
+        self.city = sys.intern(city)
+        self.state = sys.intern(state)
+        self.zip_code = sys.intern(zip_code)
+        self.delivery_deadline = sys.intern(delivery_deadline)
+        self.weight = weight
+        self.package_special_notes = package_special_notes
+        self.timestamp = timestamp
+        self.distance = distance
+        self.status = status
+        self.status_tracker = StatusHistory(status, timestamp)
+        self.truck_number = truck_number
+        self.location = None
+
+    def __str__(self):
+        return f"Package ID: {self.package_id}\n" \
+               f"Address: {self.address}\n" \
+               f"City: {self.city}\n" \
+               f"State: {self.state}\n" \
+               f"ZIP Code: {self.zip_code}\n" \
+               f"Delivery Deadline: {self.delivery_deadline}\n" \
+               f"Weight in Kilos: {self.weight}\n" \
+               f"Special Notes: {self.package_special_notes}\n" \
+               f"Timestamp: {self.timestamp}\n" \
+               f"Distance: {self.distance}\n" \
+               f"Status: {self.status}" \
+               f"Truck Number: {self.truck_number}"
+
+
+# Creates a package object from the passed in csv row from WGUPSpackage.csv, at timestamp (8:00am by default)
+# BIG O: O(1)
+# Space Complexity: O(1)
+def create_package_from_csv_row(row, timestamp=None):
+    package_id = row[0]  # Adjust the index to match the position of package_id in your CSV
+    address = row[1]  # Adjust the index for the address column
+    city = row[2]  # Adjust the index for the city column
+    state = row[3]  # Adjust the index for the state column
+    zip_code = row[4]  # Adjust the index for the zip_code column
+    delivery_deadline = row[5]  # Adjust the index for the delivery_deadline column
+    weight = row[6]
+    package_special_notes = row[7]
+    if timestamp is None:
+        timestamp = DEFAULT_TIMESTAMP  # initialize the time to 8:00am
+    package_distance = 0.0  # initialize the distance to 0.0
+    status = "At Hub"
+    truck_number = "Not Assigned"
+
+    return Package(package_id, address, city, state, zip_code, delivery_deadline, weight, package_special_notes,
+                   timestamp, package_distance, status, truck_number)
+
+
+# Load package data from WGUPSpackage.csv into a packages_table HashTable keyed by package ID, streaming the file a
+# chunk of rows at a time
+# BIG O: O(n)
+# Space Complexity: O(n)
+def load_packages(csv_path, timestamp=None):
+    packages_table = HashTable()
+    for chunk in read_csv_chunks(csv_path):
+        for row in chunk:
+            package = create_package_from_csv_row(row, timestamp)
+            # Insert the Package object into the HashTable with the package_id as the key
+            packages_table.insert(package.package_id, package)
+    return packages_table
+
+
+# Sort key putting package IDs in numeric order ("2" before "10"), with any non-numeric IDs after them
+# BIG O: O(1)
+# Space Complexity: O(1)
+def package_sort_key(package_id):
+    return (0, int(package_id), "") if package_id.isdigit() else (1, 0, package_id)
@@ -0,0 +1,152 @@
+import os
+
+from wgups.distance_matrix import DistanceMatrix
+from wgups.routing import (find_deadline_route_and_distances, find_nearest_neighbor_route_and_distances,
+                           improve_route, late_stops, route_distance)
+
+# Below this much estimated routing work (see estimated_work) the trucks are planned in process, since handing them
+# to worker processes would cost more than the routing it spreads out
+MIN_PARALLEL_WORK = 2_000_000
+# How many times the nearest neighbor work the 2-opt / Or-opt stage is counted as
+IMPROVE_WORK_FACTOR = 20
+
+# Set in each worker process by _attach_matrix
+_worker_matrix = None
+_worker_memory = None
+
+
+# The route for one truck: the stops in driving order starting at the hub, the leg lengths between them, the tour
+# distance before and after the improvement stage (equal when it did not run), and, for a deadline aware plan, the
+# stops it still reaches late as (stop, arrival, deadline).
+# BIG O: O(1)
+# Space Complexity: O(n)
+class TruckPlan:
+    def __init__(self, truck, route, legs, distance_before, distance_after, late=()):
+        self.truck = truck
+        self.route = route
+        self.legs = legs
+        self.distance_before = distance_before
+        self.distance_after = distance_after
+        self.late = late
+
+
+# Routes one truck's stops with nearest neighbor and, when asked, the 2-opt / Or-opt stage. Given deadlines (stop ->
+# minutes since midnight) along with the truck's start_minutes and speed_mph, the route is deadline aware instead,
+# and an improved route is only kept if it leaves no more stops late.
+# BIG O: O(n^2)
+# Space Complexity: O(n)
+def plan_truck_route(distance_matrix, truck, stops, improve=False, time_budget=1.0, deadlines=None, start_minutes=0,
+                     speed_mph=None):
+    if deadlines:
+        route, legs = find_deadline_route_and_distances(distance_matrix, stops, deadlines, start_minutes, speed_mph)
+        late = late_stops(distance_matrix, route, deadlines, start_minutes, speed_mph)
+    else:
+        route, legs = find_nearest_neighbor_route_and_distances(distance_matrix, stops)
+        late = ()
+    distance_before = distance_after = route_distance(distance_matrix, route)
+    if improve:
+        improved, improved_legs, _, improved_distance = improve_route(distance_matrix, route, time_budget)
+        improved_late = late_stops(distance_matrix, improved, deadlines, start_minutes, speed_mph) if deadlines else ()
+        if len(improved_late) <= len(late):
+            route, legs, distance_after, late = improved, improved_legs, improved_distance, improved_late
+    return TruckPlan(truck, route, legs, distance_before, distance_after, late)
+
+
+# Roughly how much routing planning stop_sets takes: nearest neighbor is quadratic in each truck's stops, and the
+# improvement stage repeats passes of that size.
+# BIG O: O(t) for t trucks
+# Space Complexity: O(1)
+def estimated_work(stop_sets, improve=False):
+    work = sum(len(stops) ** 2 for stops in stop_sets.values())
+    return work * IMPROVE_WORK_FACTOR if improve else work
+
+
+# Pool initializer: maps the parent's shared memory block as this worker's distance matrix, so the matrix is never
+# pickled. The parent's RoutePlanner owns the block and unlinks it when it is closed.
+def _attach_matrix(memory_name, size):
+    from multiprocessing import shared_memory
+
+    global _worker_matrix, _worker_memory
+    _worker_memory = shared_memory.SharedMemory(name=memory_name)
+    _worker_matrix = DistanceMatrix(size, _worker_memory.buf[:8 * size * size].cast('d'))
+
+
+def _plan_in_worker(truck, stops, improve, time_budget, deadlines, start_minutes, speed_mph):
+    return plan_truck_route(_worker_matrix, truck, stops, improve, time_budget, deadlines, start_minutes, speed_mph)
+
+
+# Plans fleets of routes over one distance matrix. Fleets with enough routing work (see MIN_PARALLEL_WORK) are
+# spread over a process pool that reads one copy of the matrix out of shared memory; the pool and the shared block
+# are started on the first such fleet and kept for every later one until close, so a caller planning many fleets,
+# such as a Simulation planning each departure wave, pays for them once. Usable as a context manager.
+# BIG O: O(a^2) to share the matrix the first time the pool is used, see plan for each fleet
+# Space Complexity: O(a^2) shared for a addresses
+class RoutePlanner:
+    def __init__(self, distance_matrix, max_workers=None):
+        self.distance_matrix = distance_matrix
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self._executor = None
+        self._memory = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    # Computes every truck's route at once. stop_sets maps each truck to the address indices it has to visit. Small
+    # fleets, fleets of one truck, or max_workers=1 are planned in this process. For deadline aware plans, deadlines
+    # maps each truck to its stop deadlines and start_minutes each truck to the time it leaves (see
+    # plan_truck_route). Returns a dict of truck -> TruckPlan.
+    # BIG O: O(t * n^2 / w) for t trucks of n stops across w workers
+    # Space Complexity: O(t * n)
+    def plan(self, stop_sets, improve=False, time_budget=1.0, deadlines=None, start_minutes=None, speed_mph=None):
+        stop_sets = {truck: list(stops) for truck, stops in stop_sets.items()}
+        windows = {truck: ((deadlines or {}).get(truck), (start_minutes or {}).get(truck, 0), speed_mph)
+                   for truck in stop_sets}
+        if min(self.max_workers, len(stop_sets)) <= 1 or estimated_work(stop_sets, improve) < MIN_PARALLEL_WORK:
+            return {truck: plan_truck_route(self.distance_matrix, truck, stops, improve, time_budget, *windows[truck])
+                    for truck, stops in stop_sets.items()}
+        executor = self._pool()
+        futures = {truck: executor.submit(_plan_in_worker, truck, stops, improve, time_budget, *windows[truck])
+                   for truck, stops in stop_sets.items()}
+        return {truck: future.result() for truck, future in futures.items()}
+
+    # The process pool, started with the matrix copied into a new shared memory block on first use.
+    # BIG O: O(a^2) the first time, O(1) after
+    # Space Complexity: O(a^2) shared
+    def _pool(self):
+        if self._executor is None:
+            # Imported here so that importing the library does not pay for multiprocessing unless a pool is used
+            from concurrent.futures import ProcessPoolExecutor
+            from multiprocessing import shared_memory
+
+            size = len(self.distance_matrix)
+            self._memory = shared_memory.SharedMemory(create=True, size=max(8 * size * size, 1))
+            self._memory.buf[:8 * size * size] = memoryview(self.distance_matrix.values).cast('B')
+            self._executor = ProcessPoolExecutor(self.max_workers, initializer=_attach_matrix,
+                                                 initargs=(self._memory.name, size))
+        return self._executor
+
+    # Stops the pool and frees the shared block, if they were started. The planner can still be used afterwards and
+    # starts them again when needed.
+    # BIG O: O(w) for w workers
+    # Space Complexity: O(1)
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+        if self._memory is not None:
+            self._memory.close()
+            self._memory.unlink()
+            self._memory = None
+
+
+# Computes every truck's route at once with a RoutePlanner that lasts for this one call; see RoutePlanner.plan. A
+# caller planning more than one fleet should keep a RoutePlanner instead, so its worker pool is started only once.
+# BIG O: O(t * n^2 / w) for t trucks of n stops across w workers
+# Space Complexity: O(a^2) shared for a addresses, plus O(n) per truck
+def plan_routes(distance_matrix, stop_sets, improve=False, time_budget=1.0, max_workers=None, deadlines=None,
+                start_minutes=None, speed_mph=None):
+    with RoutePlanner(distance_matrix, max_workers) as planner:
+        return planner.plan(stop_sets, improve, time_budget, deadlines, start_minutes, speed_mph)
@@ -0,0 +1,171 @@
+import json
+import time
+from contextlib import contextmanager
+
+from wgups.distance_matrix import DistanceMatrix
+from wgups.events import ARRIVE, RETURN
+from wgups.hash_table import HashTable
+
+# Simulation methods timed by Profiler.instrument, by stage. Stages nest (a departure loads trucks and then
+# constructs their routes), so each stage's time includes whatever it calls.
+STAGE_METHODS = {
+    "truck_loading": ("assign_trips", "load_trip", "place_waiting_packages"),
+    "route_construction": ("replan", "schedule_route"),
+    "delivery": ("_on_arrive", "_on_return"),
+}
+CSV_TABLES = ("packages_table", "address_book", "distance_matrix")
+COUNTERS = ("hash_table_lookups", "hash_table_probes", "matrix_row_lookups")
+
+
+# A HashTable that counts its lookups and the slots each one probes. Profiler.instrument switches a live table to
+# this class in place, so nothing is copied and an uninstrumented table pays nothing.
+# BIG O: O(1) average per lookup, probing the chain twice
+# Space Complexity: O(1)
+class _CountingHashTable(HashTable):
+    def _find_slot(self, key, key_hash):
+        counters = self.profile_counters
+        counters["hash_table_lookups"] += 1
+        counters["hash_table_probes"] += self.probe_count(key, key_hash)
+        return HashTable._find_slot(self, key, key_hash)
+
+
+# A DistanceMatrix that counts row fetches, which is how the library reads it. Distances read out of a fetched row
+# happen in C (the router's itemgetter gathers them) and are not counted one by one. Routes planned in worker
+# processes are not counted either.
+# BIG O: O(1)
+# Space Complexity: O(1)
+class _CountingDistanceMatrix(DistanceMatrix):
+    def __getitem__(self, index):
+        self.profile_counters["matrix_row_lookups"] += 1
+        return DistanceMatrix.__getitem__(self, index)
+
+
+# Per-stage timers, hot path counters and per-truck metrics for one Simulation. Nothing in the library checks
+# whether profiling is on: instrument switches the simulation's tables to counting subclasses, wraps the staged
+# methods in timers on that one instance and registers event hooks, so a Simulation that is never instrumented
+# runs exactly the code it would without this module. report returns everything as a dict, and to_json and
+# to_prometheus format it for export.
+# BIG O: O(1) per timed call or counted lookup
+# Space Complexity: O(s + t) for s stages and t trucks
+class Profiler:
+    def __init__(self):
+        self.timers = {}  # stage -> [seconds, calls]
+        self.counters = dict.fromkeys(COUNTERS, 0)
+        self.trucks = {}  # truck -> {"miles", "trips", "stops", "packages"}
+        self.simulation = None
+
+    # Times the body of a with block as one call of stage name.
+    # BIG O: O(1)
+    # Space Complexity: O(1)
+    @contextmanager
+    def stage(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._record(name, time.perf_counter() - start)
+
+    def _record(self, name, seconds):
+        timer = self.timers.get(name)
+        if timer is None:
+            self.timers[name] = [seconds, 1]
+        else:
+            timer[0] += seconds
+            timer[1] += 1
+
+    # Wraps function so every call is timed under stage name.
+    # BIG O: O(1)
+    # Space Complexity: O(1)
+    def timed(self, name, function):
+        perf_counter = time.perf_counter
+        record = self._record
+
+        def timed_call(*args, **kwargs):
+            start = perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                record(name, perf_counter() - start)
+        return timed_call
+
+    # Instruments a Simulation before it runs and returns this profiler. The CSV files are read here, each timed
+    # under csv_load.
+    # BIG O: O(n + a^2) for the loads themselves
+    # Space Complexity: O(1)
+    def instrument(self, simulation):
+        self.simulation = simulation
+        for table in CSV_TABLES:
+            with self.stage("csv_load"):
+                getattr(simulation, table)
+        simulation.packages_table.__class__ = _CountingHashTable
+        simulation.packages_table.profile_counters = self.counters
+        simulation.distance_matrix.__class__ = _CountingDistanceMatrix
+        simulation.distance_matrix.profile_counters = self.counters
+        for name, methods in STAGE_METHODS.items():
+            for method in methods:
+                setattr(simulation, method, self.timed(name, getattr(simulation, method)))
+        simulation.add_hook(ARRIVE, self._on_arrive)
+        simulation.add_hook(RETURN, self._on_return)
+        return self
+
+    def _truck(self, truck):
+        metrics = self.trucks.get(truck)
+        if metrics is None:
+            metrics = self.trucks[truck] = {"miles": 0.0, "trips": 0, "stops": 0, "packages": 0}
+        return metrics
+
+    def _on_arrive(self, event):
+        metrics = self._truck(event.truck)
+        metrics["stops"] += 1
+        metrics["packages"] += len(event.packages)
+
+    def _on_return(self, event):
+        metrics = self._truck(event.truck)
+        metrics["miles"] += event.data[1]
+        metrics["trips"] += 1
+
+    # Everything gathered so far: stage timers, counters, and per-truck miles, trips, stops, packages delivered and
+    # late packages, plus the day's totals.
+    # BIG O: O(n) to count late packages
+    # Space Complexity: O(s + t)
+    def report(self):
+        trucks = {truck: dict(metrics, late=0) for truck, metrics in self.trucks.items()}
+        late = []
+        if self.simulation is not None and self.simulation.has_run:
+            late = self.simulation.late_packages()
+            for package, delivered_at, deadline in late:
+                if package.truck_number in trucks:
+                    trucks[package.truck_number]["late"] += 1
+        return {
+            "stages": {name: {"seconds": seconds, "calls": calls} for name, (seconds, calls) in self.timers.items()},
+            "counters": dict(self.counters),
+            "trucks": {str(truck): trucks[truck] for truck in sorted(trucks)},
+            "total_distance": self.simulation.total_distance if self.simulation is not None else 0.0,
+            "late_packages": len(late),
+        }
+
+    # BIG O: O(s + t)
+    # Space Complexity: O(s + t)
+    def to_json(self):
+        return json.dumps(self.report(), indent=2)
+
+    # The report in the Prometheus text exposition format.
+    # BIG O: O(s + t)
+    # Space Complexity: O(s + t)
+    def to_prometheus(self):
+        report = self.report()
+        lines = ["# HELP wgups_stage_seconds Wall time spent in each stage of the day, including nested stages.",
+                 "# TYPE wgups_stage_seconds gauge"]
+        lines += [f'wgups_stage_seconds{{stage="{name}"}} {stage["seconds"]:.6f}'
+                  for name, stage in report["stages"].items()]
+        lines += ["# HELP wgups_stage_calls Number of times each stage ran.", "# TYPE wgups_stage_calls counter"]
+        lines += [f'wgups_stage_calls{{stage="{name}"}} {stage["calls"]}' for name, stage in report["stages"].items()]
+        for name, value in report["counters"].items():
+            lines += [f"# TYPE wgups_{name}_total counter", f"wgups_{name}_total {value}"]
+        for metric in ("miles", "trips", "stops", "packages", "late"):
+            lines += [f"# TYPE wgups_truck_{metric} gauge"]
+            lines += [f'wgups_truck_{metric}{{truck="{truck}"}} {metrics[metric]}'
+                      for truck, metrics in report["trucks"].items()]
+        lines += ["# TYPE wgups_total_distance_miles gauge", f"wgups_total_distance_miles {report['total_distance']}",
+                  "# TYPE wgups_late_packages gauge", f"wgups_late_packages {report['late_packages']}"]
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,79 @@
+import csv
+import io
+import json
+
+from wgups.package import package_sort_key
+from wgups.status_history import fleet_status_at
+
+TABLE = "table"
+CSV = "csv"
+JSONL = "jsonl"
+REPORT_FORMATS = (TABLE, CSV, JSONL)
+# The columns of a status report row, in order
+REPORT_COLUMNS = ('package_id', 'address', 'deadline', 'city', 'zip_code', 'truck_number', 'status_time', 'status')
+TABLE_HEADER = ("ID | Delivery Address | Delivery Deadline | City | Zip Code | Truck Number | Status Change Time | "
+                "Status")
+# Rows formatted before each write to the output
+CHUNK_ROWS = 1000
+
+
+# The status report rows for packages_table at timestamp, one tuple of REPORT_COLUMNS per package. With no
+# package_ids that is every package in numeric ID order, from the table's sorted_items snapshot, which is only
+# sorted again after packages are added or removed. Otherwise it is those packages in the order given, fetched in
+# one get_many pass, skipping IDs that are not in the table. A package with no status yet at timestamp has status
+# and status_time None.
+# BIG O: O(n log h), plus O(n log n) when the IDs have changed since the last report
+# Space Complexity: O(n)
+def status_rows(packages_table, timestamp, package_ids=None):
+    if package_ids is None:
+        packages = packages_table.sorted_items(package_sort_key)
+    else:
+        packages = [(package_id, package) for package_id, package
+                    in zip(package_ids, packages_table.get_many(package_ids)) if package is not None]
+    return [(package_id, package.address, package.delivery_deadline, package.city, package.zip_code,
+             package.truck_number, status_time, status)
+            for package_id, package, status, status_time in fleet_status_at(packages, timestamp)]
+
+
+# Writes status rows to output as a text table (the layout main.py has always printed), CSV with a header row, or
+# one JSON object per line. Rows are formatted a chunk at a time into one buffer and written with a single call per
+# chunk, so a report of any size costs a handful of writes instead of one per row.
+# BIG O: O(n)
+# Space Complexity: O(CHUNK_ROWS)
+def write_report(rows, output, report_format=TABLE, timestamp=None):
+    if report_format not in REPORT_FORMATS:
+        raise ValueError(f"Unknown report format {report_format!r}; expected one of {', '.join(REPORT_FORMATS)}")
+    buffer = io.StringIO()
+    if report_format == CSV:
+        writer = csv.writer(buffer, lineterminator="\n")
+        writer.writerow(REPORT_COLUMNS)
+        format_rows = writer.writerows
+    elif report_format == JSONL:
+        encode = json.JSONEncoder(default=str).encode
+
+        def format_rows(chunk):
+            buffer.write("".join(encode(dict(zip(REPORT_COLUMNS, row))) + "\n" for row in chunk))
+    else:
+        buffer.write(TABLE_HEADER + "\n")
+
+        def format_rows(chunk):
+            buffer.write("".join(_table_line(row, timestamp) for row in chunk))
+    for start in range(0, len(rows), CHUNK_ROWS):
+        format_rows(rows[start:start + CHUNK_ROWS])
+        output.write(buffer.getvalue())
+        buffer.seek(0)
+        buffer.truncate()
+    output.write(buffer.getvalue())
+
+
+# One row of the text table. A package with no status change time yet gets a status line instead of a row.
+# BIG O: O(1)
+# Space Complexity: O(1)
+def _table_line(row, timestamp):
+    package_id, address, deadline, city, zip_code, truck_number, status_time, status = row
+    if status is None:
+        status = f"Status not available at {timestamp}"
+    if not status_time:
+        return f"Status at {timestamp}: {status}\n"
+    return (f" {package_id} | {address} | {deadline} | {city} | {zip_code} | {truck_number} | {status_time} | "
+            f"{status} |\n")
@@ -0,0 +1,246 @@
+import heapq
+import math
+import time
+from operator import itemgetter
+
+# Smallest change in miles counted as an improvement, so float noise cannot make local search cycle.
+_EPSILON = 1e-9
+
+
+# Create a route for a truck to deliver the packages it has. The route is created by repeatedly stepping to the
+# closest unvisited stop: each step gathers the current point's distances to the unvisited stops with one
+# itemgetter call, then takes their min and the index of its first occurrence, all three C passes with no Python
+# call per stop. The stop is then deleted at that index, which moves the tail of the list down but never searches
+# it. Keeping the list in its original order means ties go to the stop that came first in remaining_packages.
+# Duplicate stops (several packages for one address) collapse into one visit. Returns the route, starting at the hub,
+# and the length of every leg driven; nothing is kept between calls.
+# BIG O: O(n^2)
+# Space Complexity: O(n)
+def find_nearest_neighbor_route_and_distances(distance_matrix, remaining_packages, start=0):
+    unvisited = list(dict.fromkeys(remaining_packages))
+    if start in unvisited:
+        unvisited.remove(start)
+    route = [start]
+    legs = []
+    current_point = start
+    while unvisited:
+        row = distance_matrix[current_point]
+        # itemgetter of one stop returns the distance itself rather than a tuple
+        distances = itemgetter(*unvisited)(row) if len(unvisited) > 1 else (row[unvisited[0]],)
+        nearest_distance = min(distances)
+        nearest = distances.index(nearest_distance)
+        current_point = unvisited[nearest]
+        del unvisited[nearest]
+        legs.append(nearest_distance)
+        route.append(current_point)
+    return route, legs
+
+
+# The rank of every address on one nearest neighbor route from the hub through all of them, as a dict of address
+# index -> rank. Neighbouring ranks are neighbouring stops, so the loader uses it to fill trips with nearby stops.
+# BIG O: O(a^2)
+# Space Complexity: O(a)
+def rank_stops(distance_matrix):
+    route, _ = find_nearest_neighbor_route_and_distances(distance_matrix, range(len(distance_matrix)))
+    return {point: rank for rank, point in enumerate(route)}
+
+
+# Deadline aware routing. Starts from the nearest neighbor route and keeps it whenever it already reaches every stop
+# in time, so mileage only changes when a deadline forces it. Otherwise the route is rebuilt by cheapest insertion:
+# stops with a deadline go in first, earliest deadline first, then the rest in nearest neighbor order, each at the
+# position that makes nothing late (its own arrival, and the delay it pushes onto every later stop, checked against
+# the smallest slack left after that position) and adds the fewest miles. A stop that cannot go in on time takes the
+# position that makes it least late. The rebuilt route is used only if it has fewer late stops than the nearest
+# neighbor one. deadlines maps a stop to minutes since midnight; the truck leaves start at start_minutes and drives
+# at speed_mph. Returns the route and its legs, like find_nearest_neighbor_route_and_distances.
+# BIG O: O(n^2)
+# Space Complexity: O(n)
+def find_deadline_route_and_distances(distance_matrix, remaining_packages, deadlines, start_minutes, speed_mph,
+                                      start=0):
+    route, legs = find_nearest_neighbor_route_and_distances(distance_matrix, remaining_packages, start)
+    late = late_stops(distance_matrix, route, deadlines, start_minutes, speed_mph)
+    if not late:
+        return route, legs
+    # Each deadline as the miles the truck can have driven by then
+    budget = {stop: (deadline - start_minutes) * speed_mph / 60 for stop, deadline in deadlines.items()}
+    timed = sorted((stop for stop in route[1:] if stop in budget), key=budget.__getitem__)
+    tour = [start]
+    for stop in timed + [stop for stop in route[1:] if stop not in budget]:
+        _insert_stop(distance_matrix, tour, stop, budget)
+    if len(late_stops(distance_matrix, tour, deadlines, start_minutes, speed_mph)) < len(late):
+        return tour, route_legs(distance_matrix, tour)
+    return route, legs
+
+
+# Inserts stop into tour where it makes the least lateness, then adds the fewest miles. reach is the miles driven on
+# arriving at each position and slack[i] the least spare miles any deadline stop from position i on has left.
+# BIG O: O(n)
+# Space Complexity: O(n)
+def _insert_stop(distance_matrix, tour, stop, budget):
+    size = len(tour)
+    reach = [0.0] * size
+    for i in range(1, size):
+        reach[i] = reach[i - 1] + distance_matrix[tour[i - 1]][tour[i]]
+    slack = [math.inf] * (size + 1)
+    for i in range(size - 1, 0, -1):
+        slack[i] = min(slack[i + 1], budget.get(tour[i], math.inf) - reach[i])
+    row = distance_matrix[stop]
+    own_budget = budget.get(stop, math.inf)
+    best = None
+    position = size
+    for i in range(size):
+        a = tour[i]
+        b = tour[i + 1] if i + 1 < size else tour[0]
+        added = row[a] + row[b] - distance_matrix[a][b]
+        # Inserting at the end only changes the drive back to the hub, which has no deadline
+        delay = added if i + 1 < size else 0.0
+        lateness = max(0.0, reach[i] + row[a] - own_budget - _EPSILON) + max(0.0, delay - slack[i + 1] - _EPSILON)
+        if best is None or (lateness, added) < best:
+            best = (lateness, added)
+            position = i + 1
+    tour.insert(position, stop)
+
+
+# The stops of route reached after their deadline, as (stop, arrival, deadline) in route order with times in
+# minutes since midnight, for a truck leaving route[0] at start_minutes and driving at speed_mph.
+# BIG O: O(n)
+# Space Complexity: O(l) for l late stops
+def late_stops(distance_matrix, route, deadlines, start_minutes, speed_mph):
+    late = []
+    distance = 0.0
+    for i in range(1, len(route)):
+        distance += distance_matrix[route[i - 1]][route[i]]
+        deadline = deadlines.get(route[i])
+        if deadline is not None:
+            arrival = start_minutes + distance / speed_mph * 60
+            if arrival > deadline + _EPSILON:
+                late.append((route[i], arrival, deadline))
+    return late
+
+
+# Total miles for a route that returns to its starting point once the last stop is made.
+# BIG O: O(n)
+# Space Complexity: O(1)
+def route_distance(distance_matrix, route):
+    if len(route) < 2:
+        return 0.0
+    total = sum(distance_matrix[route[i]][route[i + 1]] for i in range(len(route) - 1))
+    return total + distance_matrix[route[-1]][route[0]]
+
+
+# The leg lengths driven along a route, in the same shape find_nearest_neighbor_route_and_distances returns them.
+# BIG O: O(n)
+# Space Complexity: O(n)
+def route_legs(distance_matrix, route):
+    return [distance_matrix[route[i]][route[i + 1]] for i in range(len(route) - 1)]
+
+
+# For every stop on the route, the neighbor_count closest other stops on the same route, nearest first.
+# BIG O: O(n^2)
+# Space Complexity: O(n * k)
+def build_neighbor_lists(distance_matrix, route, neighbor_count=8):
+    neighbors = {}
+    for point in route:
+        row = distance_matrix[point]
+        others = [other for other in route if other != point]
+        neighbors[point] = heapq.nsmallest(neighbor_count, others, key=row.__getitem__)
+    return neighbors
+
+
+# Local search improvement stage for a route out of the nearest neighbor router. Applies improving 2-opt moves
+# (reverse a stretch of the tour) and Or-opt moves (relocate a run of one to three stops, either way round) until a
+# full pass finds nothing or time_budget seconds have gone by. Candidate moves only pair a stop with its closest
+# neighbors and each is scored by the change in the few edges it touches, so a pass costs O(n * k) evaluations plus
+# O(n) per move applied. The tour is closed through route[0] (the hub), which never moves.
+# Returns the improved route, its legs, and the tour distance before and after.
+# BIG O: O(n^2) for the neighbor lists, then O(n * k + n * m) per pass where m is the number of moves applied
+# Space Complexity: O(n * k)
+def improve_route(distance_matrix, route, time_budget=1.0, neighbor_count=8):
+    tour = list(route)
+    distance_before = route_distance(distance_matrix, tour)
+    if len(tour) < 4:
+        return tour, route_legs(distance_matrix, tour), distance_before, distance_before
+    deadline = time.perf_counter() + time_budget
+    neighbors = build_neighbor_lists(distance_matrix, tour, neighbor_count)
+    position = {point: index for index, point in enumerate(tour)}
+    improved = True
+    while improved and time.perf_counter() < deadline:
+        improved = False
+        for i in range(len(tour)):
+            if time.perf_counter() >= deadline:
+                break
+            if (_try_two_opt(distance_matrix, tour, position, neighbors, i)
+                    or _try_or_opt(distance_matrix, tour, position, neighbors, i)):
+                improved = True
+    return tour, route_legs(distance_matrix, tour), distance_before, route_distance(distance_matrix, tour)
+
+
+# Tries to replace the edges (tour[i], next) and (c, next of c) with (tour[i], c) and (next, next of c) for each
+# close neighbor c of tour[i], reversing the stretch in between on the first improving candidate.
+# BIG O: O(k) to evaluate, O(n) to apply
+# Space Complexity: O(1)
+def _try_two_opt(distance_matrix, tour, position, neighbors, i):
+    size = len(tour)
+    a = tour[i]
+    b = tour[(i + 1) % size]
+    row_a = distance_matrix[a]
+    for c in neighbors[a]:
+        gain_limit = row_a[b] - row_a[c]
+        if gain_limit <= _EPSILON:
+            # Neighbors are sorted, so no later c can be closer to a than b is
+            return False
+        j = position[c]
+        d = tour[(j + 1) % size]
+        if c == b or d == a:
+            continue
+        gain = gain_limit + distance_matrix[c][d] - distance_matrix[b][d]
+        if gain > _EPSILON:
+            low, high = (i + 1, j) if i < j else (j + 1, i)
+            tour[low:high + 1] = tour[low:high + 1][::-1]
+            _update_positions(tour, position, low, high)
+            return True
+    return False
+
+
+# Tries to move the run of one to three stops starting at tour[i] between a close neighbor c and the stop after it,
+# in whichever orientation is shorter. The hub at tour[0] is never part of a moved run.
+# BIG O: O(k) to evaluate, O(n) to apply
+# Space Complexity: O(n)
+def _try_or_opt(distance_matrix, tour, position, neighbors, i):
+    size = len(tour)
+    if i == 0:
+        return False
+    for length in (1, 2, 3):
+        if i + length > size or length >= size - 2:
+            break
+        first = tour[i]
+        last = tour[i + length - 1]
+        before = tour[i - 1]
+        after = tour[(i + length) % size]
+        removal_gain = (distance_matrix[before][first] + distance_matrix[last][after]
+                        - distance_matrix[before][after])
+        if removal_gain <= _EPSILON:
+            continue
+        segment = tour[i:i + length]
+        for c in neighbors[first] + neighbors[last]:
+            if c in segment or c == before:
+                continue
+            e = tour[(position[c] + 1) % size]
+            if e in segment:
+                continue
+            row_c = distance_matrix[c]
+            row_e = distance_matrix[e]
+            forward = row_c[first] + row_e[last]
+            backward = row_c[last] + row_e[first]
+            if removal_gain - (min(forward, backward) - row_c[e]) > _EPSILON:
+                insert_at = position[c] + 1 if position[c] < i else position[c] + 1 - length
+                del tour[i:i + length]
+                tour[insert_at:insert_at] = segment if forward <= backward else segment[::-1]
+                _update_positions(tour, position, min(i, insert_at), max(i + length, insert_at + length) - 1)
+                return True
+    return False
+
+
+def _update_positions(tour, position, low, high):
+    for index in range(low, high + 1):
+        position[tour[index]] = index
@@ -0,0 +1,256 @@
+import os
+import time
+from datetime import datetime, timedelta
+from functools import cached_property
+
+from wgups.address_book import load_address_book
+from wgups.distance_matrix import load_distance_matrix
+from wgups.hash_table import HashTable
+from wgups.ingest import read_csv_chunks, read_manifest_deltas
+from wgups.loading import TRUCK_CAPACITY, parse_clock_minutes, parse_package_constraints
+from wgups.package import create_package_from_csv_row
+from wgups.routing import rank_stops
+from wgups.simulation import DATA_DIR, TRUCK_SPEED_MPH, Simulation
+
+# Below this many packages across all scenarios a process pool costs more to start than the days it would spread out
+MIN_PARALLEL_PACKAGES = 2000
+# The columns of a scenario CSV, in any order after a header row; only name is required
+SCENARIO_FIELDS = ('name', 'trucks', 'day', 'day_start', 'speed_mph', 'capacity', 'improve_routes',
+                   'deadline_routing', 'manifest', 'deltas')
+_TRUE = ('1', 'true', 'yes', 'y')
+
+# Set in each worker process by _load_context
+_worker_context = None
+
+
+# One what-if day: how many trucks run, on which day and from what time, how fast they drive, how many packages a
+# truck takes, which routing options are on, and which manifest and delta files it plays. manifest is a
+# WGUPSpackage.csv style file, None for the data directory's own, so several days can be compared over one map.
+# Only a scenario on the data directory's own manifest gets that directory's address corrections (see Simulation).
+# BIG O: O(1)
+# Space Complexity: O(1)
+class Scenario:
+    def __init__(self, name, trucks=2, day=datetime(2023, 10, 24), day_start=timedelta(hours=8),
+                 speed_mph=TRUCK_SPEED_MPH, capacity=TRUCK_CAPACITY, improve_routes=False, deadline_routing=False,
+                 manifest=None, deltas=()):
+        self.name = name
+        self.trucks = trucks
+        self.day = day
+        self.day_start = day_start
+        self.speed_mph = speed_mph
+        self.capacity = capacity
+        self.improve_routes = improve_routes
+        self.deadline_routing = deadline_routing
+        self.manifest = manifest
+        self.deltas = tuple(deltas)
+
+
+# How a scenario's day went. on_time counts packages delivered by their deadline (any time for EOD), late the
+# packages with a deadline delivered after it or not at all, and finish is when the last truck got back to the hub
+# (None if no truck left). seconds is the time the scenario took to simulate.
+# BIG O: O(1)
+# Space Complexity: O(1)
+class ScenarioResult:
+    def __init__(self, name, miles, packages, on_time, late, unassigned, finish, seconds):
+        self.name = name
+        self.miles = miles
+        self.packages = packages
+        self.on_time = on_time
+        self.late = late
+        self.unassigned = unassigned
+        self.finish = finish
+        self.seconds = seconds
+
+    @property
+    def on_time_rate(self):
+        return self.on_time / self.packages if self.packages else 1.0
+
+
+# Everything scenarios over one data directory have in common, each loaded or worked out once and shared by every
+# Simulation built from it: the address book, the distance matrix (memory mapped from its .npy cache), each
+# address's rank for the loader, and for every manifest its rows, the address book index of each row and each
+# package's parsed loading rules. Only the Package objects, which a day changes, are made fresh per scenario.
+# BIG O: O(a^2) to load, O(n) per manifest
+# Space Complexity: O(a^2 + n)
+class ScenarioContext:
+    def __init__(self, data_dir=DATA_DIR):
+        self.data_dir = data_dir
+        self.manifests = {}  # manifest path (None for the data directory's) -> (rows, locations, constraints)
+        self.delta_files = {}  # delta file path -> list of ManifestDelta
+
+    @cached_property
+    def address_book(self):
+        return load_address_book(os.path.join(self.data_dir, 'WGUPSaddress.csv'))
+
+    @cached_property
+    def distance_matrix(self):
+        return load_distance_matrix(os.path.join(self.data_dir, 'WGUPSdistance.csv'))
+
+    @cached_property
+    def stop_rank(self):
+        return rank_stops(self.distance_matrix)
+
+    # The rows of a manifest, the address book index each one's address resolves to, and package ID ->
+    # PackageConstraints, read and worked out on first use.
+    # BIG O: O(n) the first time, O(1) after
+    # Space Complexity: O(n)
+    def manifest(self, path=None):
+        if path not in self.manifests:
+            rows = [row for chunk in read_csv_chunks(path or os.path.join(self.data_dir, 'WGUPSpackage.csv'))
+                    for row in chunk]
+            resolve = self.address_book.resolve
+            locations = [resolve(row[1]) for row in rows]
+            constraints = {}
+            for row in rows:
+                package = create_package_from_csv_row(row)
+                constraints[package.package_id] = parse_package_constraints(package)
+            self.manifests[path] = (rows, locations, constraints)
+        return self.manifests[path]
+
+    # BIG O: O(d) the first time, O(1) after
+    # Space Complexity: O(d)
+    def deltas(self, path):
+        if path not in self.delta_files:
+            self.delta_files[path] = list(read_manifest_deltas(path))
+        return self.delta_files[path]
+
+    # A Simulation of scenario that has not run yet, sharing this context's tables. Its routes are planned in this
+    # process, since scenarios are what gets spread over worker processes.
+    # BIG O: O(n)
+    # Space Complexity: O(n)
+    def simulation(self, scenario):
+        rows, locations, constraints = self.manifest(scenario.manifest)
+        simulation = Simulation(self.data_dir, scenario.day, range(1, scenario.trucks + 1), scenario.day_start,
+                                improve_routes=scenario.improve_routes, max_workers=1, speed_mph=scenario.speed_mph,
+                                deadline_routing=scenario.deadline_routing, capacity=scenario.capacity)
+        if scenario.manifest is not None:
+            simulation.address_corrections = []  # they were written for the data directory's manifest
+        simulation.address_book = self.address_book
+        simulation.distance_matrix = self.distance_matrix
+        simulation.stop_rank = self.stop_rank
+        packages_table = HashTable(len(rows))
+        for row, location in zip(rows, locations):
+            package = create_package_from_csv_row(row, simulation.day_start)
+            package.location = location
+            packages_table.insert(package.package_id, package)
+        simulation.packages_table = packages_table
+        simulation.package_constraints = dict(constraints)
+        for path in scenario.deltas:
+            simulation.ingest(self.deltas(path))
+        return simulation
+
+
+# Runs one scenario's day on context and sums it up.
+# BIG O: see Simulation.run
+# Space Complexity: O(n)
+def run_scenario(context, scenario):
+    start = time.perf_counter()
+    simulation = context.simulation(scenario)
+    miles = simulation.run()
+    late = simulation.late_packages()
+    late_ids = {package.package_id for package, delivered_at, deadline in late}
+    on_time = sum(package.status == "Delivered" and package_id not in late_ids
+                  for package_id, package in simulation.packages_table)
+    returns = [progress.ready_time for progress in simulation.truck_progress.values() if progress.ready_time]
+    return ScenarioResult(scenario.name, miles, len(simulation.packages_table), on_time, len(late),
+                          len(simulation.unassigned_packages), max(returns, default=None),
+                          time.perf_counter() - start)
+
+
+# Pool initializer: a worker's context reuses what the parent already worked out (address ranks, parsed manifests
+# and deltas) and maps the distance matrix from its .npy cache, which the parent's load left fresh, so the matrix
+# is shared through the page cache instead of being copied or parsed again.
+def _load_context(data_dir, stop_rank, manifests, delta_files):
+    global _worker_context
+    _worker_context = ScenarioContext(data_dir)
+    _worker_context.stop_rank = stop_rank
+    _worker_context.manifests = manifests
+    _worker_context.delta_files = delta_files
+
+
+def _run_in_worker(scenario):
+    return run_scenario(_worker_context, scenario)
+
+
+# Runs every scenario over the data directory and returns their ScenarioResults in the same order. The shared
+# context is loaded once; each manifest and delta file is parsed once. The scenarios are then spread over a process
+# pool, each worker receiving the precomputed data once; few or small scenarios, or max_workers=1, run in this
+# process instead.
+# BIG O: O(a^2 + s * day / w) for s scenarios across w workers
+# Space Complexity: O(a^2 + n) shared, plus O(n) per scenario running
+def run_scenarios(scenarios, data_dir=DATA_DIR, max_workers=None):
+    scenarios = list(scenarios)
+    context = ScenarioContext(data_dir)
+    packages = 0
+    for scenario in scenarios:
+        packages += len(context.manifest(scenario.manifest)[0])
+        for path in scenario.deltas:
+            context.deltas(path)
+    stop_rank = context.stop_rank  # worked out once here rather than in every worker
+    workers = min(max_workers or os.cpu_count() or 1, len(scenarios))
+    if workers <= 1 or packages < MIN_PARALLEL_PACKAGES:
+        return [run_scenario(context, scenario) for scenario in scenarios]
+
+    # Imported here so that importing the library does not pay for multiprocessing unless a pool is used
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(workers, initializer=_load_context,
+                             initargs=(data_dir, stop_rank, context.manifests, context.delta_files)) as executor:
+        return list(executor.map(_run_in_worker, scenarios))
+
+
+# Reads scenarios from a CSV file with a header row naming any of SCENARIO_FIELDS, for example
+# "name,trucks,day_start,speed_mph" then "three trucks at nine,3,9:00 AM,18". Blank cells keep the Scenario
+# defaults; day is YYYY-MM-DD, day_start a clock time, the yes/no columns take yes, true or 1, and deltas lists
+# delta files separated by semicolons.
+# BIG O: O(s)
+# Space Complexity: O(s)
+def read_scenarios(csv_path):
+    scenarios = []
+    header = None
+    for chunk in read_csv_chunks(csv_path):
+        for row in chunk:
+            if header is None:
+                header = [column.strip().lower() for column in row]
+                unknown = [column for column in header if column not in SCENARIO_FIELDS]
+                if 'name' not in header or unknown:
+                    raise ValueError(f"Scenario file {csv_path} needs a name column and only these columns: "
+                                     f"{', '.join(SCENARIO_FIELDS)}")
+                continue
+            cells = {column: value.strip() for column, value in zip(header, row) if value.strip()}
+            scenarios.append(Scenario(**{field: _parse_field(field, value) for field, value in cells.items()}))
+    return scenarios
+
+
+def _parse_field(field, value):
+    if field in ('trucks', 'capacity'):
+        return int(value)
+    if field == 'speed_mph':
+        return float(value)
+    if field == 'day':
+        return datetime.strptime(value, "%Y-%m-%d")
+    if field == 'day_start':
+        minutes = parse_clock_minutes(value)
+        if minutes is None:
+            raise ValueError(f"Scenario day_start {value!r} is not a clock time such as 8:00 AM")
+        return timedelta(minutes=minutes)
+    if field in ('improve_routes', 'deadline_routing'):
+        return value.lower() in _TRUE
+    if field == 'deltas':
+        return [path.strip() for path in value.split(';') if path.strip()]
+    return value
+
+
+# The results side by side, one line per scenario: miles, on-time rate, late and unassigned packages, when the last
+# truck got back, and how long the scenario took to simulate.
+# BIG O: O(s)
+# Space Complexity: O(s)
+def comparison_table(results):
+    width = max([len("Scenario")] + [len(result.name) for result in results])
+    lines = [f"{'Scenario':<{width}} | {'Miles':>10} | {'On time':>7} | {'Late':>6} | {'Unassigned':>10} | "
+             f"{'Finish':>16} | {'Seconds':>7}"]
+    for result in results:
+        finish = f"{result.finish:%Y-%m-%d %H:%M}" if result.finish else "-"
+        lines.append(f"{result.name:<{width}} | {result.miles:>10,.1f} | {result.on_time_rate:>7.1%} | "
+                     f"{result.late:>6,} | {result.unassigned:>10,} | {finish:>16} | {result.seconds:>7.3f}")
+    return "\n".join(lines)
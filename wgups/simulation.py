@@ -0,0 +1,523 @@
+import os
+from bisect import insort
+from datetime import datetime, timedelta
+from functools import cached_property
+
+from wgups.address_book import load_address_book
+from wgups.distance_matrix import load_distance_matrix
+from wgups.events import ARRIVE, AVAILABLE, DELTA, DEPART, RETURN, EventQueue
+from wgups.ingest import ADD, REMOVE, read_manifest_deltas
+from wgups.loading import TRUCK_CAPACITY, assign_packages_to_trucks, parse_clock_minutes, parse_package_constraints
+from wgups.manifest_store import ManifestStore
+from wgups.package import create_package_from_csv_row, load_packages
+from wgups.planner import RoutePlanner
+from wgups.routing import find_deadline_route_and_distances, find_nearest_neighbor_route_and_distances, rank_stops
+from wgups.status_history import fleet_status_at
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'Helper')
+TRUCK_SPEED_MPH = 18
+# Address corrections that belong to a data directory's own manifest, as delta rows (see wgups.ingest). A row with
+# no time takes effect at address_correction_time; Helper/ uses it for package 9, listed at the wrong address.
+CORRECTIONS_FILE = 'WGUPScorrections.csv'
+
+
+# One delivery day. Nothing is read from disk until it is first needed: the package manifest, the address book and
+# the distance matrix each load on first access, so creating a Simulation (or importing this module) is cheap, and
+# every Simulation owns its own tables so several can run side by side in one process. The day itself is driven by
+# an EventQueue (see run); add_hook registers callbacks on its events for metrics.
+# BIG O: O(1) to create, see run for the day itself
+# Space Complexity: O(n + a^2) for n packages and a addresses once loaded
+class Simulation:
+    def __init__(self, data_dir=DATA_DIR, day=datetime(2023, 10, 24), truck_numbers=(1, 2),
+                 day_start=timedelta(hours=8), address_correction_time=timedelta(hours=10, minutes=20),
+                 improve_routes=False, max_workers=None, speed_mph=TRUCK_SPEED_MPH, deadline_routing=False,
+                 capacity=TRUCK_CAPACITY):
+        self.data_dir = data_dir
+        self.day = day
+        self.day_start = day + day_start
+        self.address_correction_time = day + address_correction_time
+        self.truck_numbers = tuple(truck_numbers)
+        self.improve_routes = improve_routes
+        self.max_workers = max_workers
+        self.speed_mph = speed_mph
+        self.deadline_routing = deadline_routing
+        self.capacity = capacity
+        # Create a list of packages for each truck
+        self.truck_packages = {truck_number: [] for truck_number in self.truck_numbers}
+        self.truck_package_counts = {truck_number: 0 for truck_number in self.truck_numbers}
+        self.total_distance = 0
+        self.trips = []
+        self.unassigned_packages = []
+        self.route_plans = []  # (trip, TruckPlan) in the order the trips were driven
+        self.truck_plans = {}  # truck -> TruckPlan for the packages it has loaded now
+        self.replan_trucks = set()  # trucks whose load changed since truck_plans was last planned
+        self.package_trips = {}  # package ID -> Trip it is assigned to while it waits at the hub
+        self.waiting_packages = []  # added during the day, waiting for a trip with room
+        self.pending_deltas = []  # ManifestDelta not yet due, sorted by time
+        self.package_constraints = {}  # package ID -> PackageConstraints, see constraints_of
+        self.events = EventQueue()
+        self.truck_progress = {}  # truck -> _TruckProgress of the trip it is driving
+        self.has_run = False
+
+    @cached_property
+    def packages_table(self):
+        return load_packages(os.path.join(self.data_dir, 'WGUPSpackage.csv'), self.day_start)
+
+    @cached_property
+    def address_book(self):
+        return load_address_book(os.path.join(self.data_dir, 'WGUPSaddress.csv'))
+
+    # The data directory's CORRECTIONS_FILE, or none when it has no such file, queued by run. Like the tables it can
+    # be set beforehand, for example to an empty list for a manifest the corrections were not written for.
+    # BIG O: O(c)
+    # Space Complexity: O(c)
+    @cached_property
+    def address_corrections(self):
+        corrections_path = os.path.join(self.data_dir, CORRECTIONS_FILE)
+        if not os.path.exists(corrections_path):
+            return []
+        corrections = list(read_manifest_deltas(corrections_path))
+        for delta in corrections:
+            if delta.time is None:
+                delta.time = self._minutes(self.address_correction_time)
+        return corrections
+
+    # Dense symmetric matrix, memory mapped from WGUPSdistance.npy when that cache was made from this exact CSV
+    @cached_property
+    def distance_matrix(self):
+        return load_distance_matrix(os.path.join(self.data_dir, 'WGUPSdistance.csv'))
+
+    # Every address's rank on one route through all of them (see rank_stops), for the loader. Like the tables it is
+    # computed on first use and can be set beforehand to share it between simulations over the same map (see
+    # wgups.scenarios).
+    # BIG O: O(a^2)
+    # Space Complexity: O(a)
+    @cached_property
+    def stop_rank(self):
+        return rank_stops(self.distance_matrix)
+
+    # Plans every departure wave's routes, keeping its worker pool, if the waves need one, until run finishes
+    @cached_property
+    def planner(self):
+        return RoutePlanner(self.distance_matrix, self.max_workers)
+
+    def _minutes(self, moment):
+        return (moment - self.day) // timedelta(minutes=1)
+
+    # Calls callback(event) after every event of kind (see wgups.events) while the day runs.
+    # BIG O: O(1)
+    # Space Complexity: O(1)
+    def add_hook(self, kind, callback):
+        self.events.add_hook(kind, callback)
+
+    # Loads the packages the loader assigned to a trip onto its truck as it leaves the hub at start_time.
+    # BIG O: O(m) where m is the number of packages on the trip
+    # Space Complexity: O(1)
+    def load_trip(self, trip, start_time):
+        for package in trip.packages:
+            self.truck_packages[trip.truck_number].append(package)
+            package.status = "In route"
+            package.timestamp = start_time
+            package.status_tracker.append(package.timestamp, package.status)
+            package.truck_number = trip.truck_number
+            self.package_trips.pop(package.package_id, None)
+            self.truck_package_counts[trip.truck_number] += 1
+        self.replan_trucks.add(trip.truck_number)
+
+    # Takes manifest deltas (see wgups.ingest), from a list or streamed from read_manifest_deltas. A delta with no
+    # time, or one that is already due, is applied at once; the rest wait until the day reaches their time, queued
+    # as events if it is already running. Once run has finished there is no day left to apply them to, so ingest
+    # raises RuntimeError. Returns the trucks marked for replanning.
+    # BIG O: O(d log p) for d deltas with p pending, plus apply_delta for each one applied
+    # Space Complexity: O(p)
+    def ingest(self, deltas):
+        if self.has_run:
+            raise RuntimeError("The day has already run; ingest deltas before calling run")
+        now = self._minutes(self.day_start) if self.events.now is None else self.events.now
+        for delta in deltas:
+            if delta.time is None or delta.time <= now:
+                self.apply_delta(delta)
+            elif self.events.now is not None:
+                self.events.schedule(delta.time, DELTA, data=delta)
+            else:
+                insort(self.pending_deltas, delta, key=lambda pending: pending.time)
+        return self.replan_trucks
+
+    # Streams a delta CSV file into ingest a chunk at a time.
+    # BIG O: O(d log p)
+    # Space Complexity: O(p)
+    def ingest_file(self, csv_path):
+        return self.ingest(read_manifest_deltas(csv_path))
+
+    # Applies one delta to packages_table in place. Only what the change touches is updated: a package on a truck
+    # marks that truck for replanning, one still waiting for its trip is taken off or left on that trip, and a
+    # package added while the day is running waits for the next trip with room. Delivered packages keep their
+    # history and are not removed.
+    # BIG O: O(1) amortized, O(m) to take a package off a truck carrying m packages
+    # Space Complexity: O(1)
+    def apply_delta(self, delta):
+        package = self.packages_table.get(delta.package_id)
+        if delta.action == ADD and package is None:
+            timestamp = self.day_start if delta.time is None else max(self.day_start,
+                                                                      self.day + timedelta(minutes=delta.time))
+            package = create_package_from_csv_row(delta.package_row(), timestamp)
+            self.package_constraints.pop(package.package_id, None)
+            self.locate(package)
+            self.packages_table.insert(package.package_id, package)
+            if self.events.now is not None:
+                self.waiting_packages.append(package)
+            return
+        if package is None or package.status == "Delivered":
+            return
+        on_truck = package.status == "In route" and package in self.truck_packages.get(package.truck_number, ())
+        if delta.action == REMOVE:
+            if on_truck:
+                self._file_stop(package, remove=True)
+                self.truck_packages[package.truck_number].remove(package)
+                self.truck_package_counts[package.truck_number] -= 1
+                self.replan_trucks.add(package.truck_number)
+            trip = self.package_trips.pop(package.package_id, None)
+            if trip is not None:
+                trip.packages.remove(package)
+            if package in self.waiting_packages:
+                self.waiting_packages.remove(package)
+            self.packages_table.delete(package.package_id)
+            return
+        # A correction, or an add for a package that is already on the manifest
+        if on_truck and 'address' in delta.fields:
+            self._file_stop(package, remove=True)
+        for field, value in delta.fields.items():
+            setattr(package, field, value)
+        self.package_constraints.pop(package.package_id, None)
+        if 'address' in delta.fields:
+            self.locate(package)
+            if on_truck:
+                self._file_stop(package)
+                self.replan_trucks.add(package.truck_number)
+
+    # Files a package on a driving truck under its location in the stop index of the route being driven, or with
+    # remove takes it out, so arrivals already queued deliver exactly what the truck carries for each stop.
+    # BIG O: O(m) for m packages for the stop
+    # Space Complexity: O(1)
+    def _file_stop(self, package, remove=False):
+        progress = self.truck_progress.get(package.truck_number)
+        if progress is None:
+            return
+        if not remove:
+            progress.stop_index.setdefault(package.location, []).append(package)
+            return
+        packages = progress.stop_index.get(package.location)
+        if packages is not None and package in packages:
+            packages.remove(package)
+            if not packages:
+                del progress.stop_index[package.location]
+
+    # Resolves a package's address to its address book index once and caches it on the package as location; the
+    # routing and delivery code only ever reads the cached index. Returns the index, or None if the address did not
+    # resolve (see AddressBook.resolve and address_report).
+    # BIG O: O(1) for an address the book knows, see AddressBook.resolve otherwise
+    # Space Complexity: O(1)
+    def locate(self, package):
+        package.location = self.address_book.resolve(package.address)
+        return package.location
+
+    # Locates every package on the manifest that has not been located yet.
+    # BIG O: O(n)
+    # Space Complexity: O(1)
+    def locate_packages(self):
+        for package_id, package in self.packages_table:
+            if package.location is None:
+                self.locate(package)
+
+    # The addresses that did not match the address book exactly or by canonical key: (address, matched address,
+    # score) for each one fuzzy matched, and (address, closest address or None, score) for each one left unresolved,
+    # whose packages stay off the trucks.
+    # BIG O: O(u)
+    # Space Complexity: O(u)
+    def address_report(self):
+        return self.address_book.fuzzy_report()
+
+    # A package's loading rules (see parse_package_constraints), parsed once per package and kept in
+    # package_constraints until a delta changes the package.
+    # BIG O: O(1)
+    # Space Complexity: O(1)
+    def constraints_of(self, package):
+        constraints = self.package_constraints.get(package.package_id)
+        if constraints is None:
+            constraints = self.package_constraints[package.package_id] = parse_package_constraints(package)
+        return constraints
+
+    # Groups the packages currently loaded on a truck by the address index of their delivery location, so a route
+    # only ever touches the packages on its own truck.
+    # BIG O: O(m) where m is the number of packages on the truck
+    # Space Complexity: O(m)
+    def build_truck_stop_index(self, truck_number):
+        stop_index = {}
+        for package in self.truck_packages[truck_number]:
+            stop_index.setdefault(package.location, []).append(package)
+        return stop_index
+
+    # Returns the address indices of every package still on the truck, in load order, for the router.
+    # BIG O: O(m) where m is the number of packages on the truck
+    # Space Complexity: O(m)
+    def truck_route_indices(self, truck_number):
+        # An address missing from the address book cannot be routed; its package stays on the truck
+        return [package.location for package in self.truck_packages[truck_number] if package.location is not None]
+
+    # Assigns every package to a truck trip, ranking each address by its place on one route through all of them so
+    # the loader fills each trip with nearby stops. Packages whose address does not resolve are left unassigned.
+    # BIG O: O(a^2 + n log n)
+    # Space Complexity: O(n + a)
+    def assign_trips(self):
+        self.locate_packages()
+        stop_rank = self.stop_rank
+        located = [package for package_id, package in self.packages_table if package.location is not None]
+        stop_order = {package.address: stop_rank[package.location] for package in located}
+        self.trips, self.unassigned_packages = assign_packages_to_trucks(
+            located, self.truck_numbers,
+            day_start=self._minutes(self.day_start),
+            address_correction_time=self._minutes(self.address_correction_time),
+            capacity=self.capacity, stop_order=stop_order,
+            constraints={package.package_id: self.constraints_of(package) for package in located})
+        self.unassigned_packages.extend(package for package_id, package in self.packages_table
+                                        if package.location is None)
+        self.package_trips = {package.package_id: trip for trip in self.trips for package in trip.packages}
+        return self.trips
+
+    # Puts the packages added during the day on the emptiest trip of this departure that has room, their truck and
+    # an address in the address book. Packages that do not fit wait for a later departure.
+    # BIG O: O(w * t) for w waiting packages and t trips leaving together
+    # Space Complexity: O(1)
+    def place_waiting_packages(self, wave, departure):
+        for package in list(self.waiting_packages):
+            constraints = self.constraints_of(package)
+            if package.location is None or \
+                    (constraints.available_at is not None and constraints.available_at > departure):
+                continue
+            trips = [trip for trip in wave if len(trip.packages) < self.capacity and
+                     constraints.required_truck in (None, trip.truck_number)]
+            if trips:
+                trip = min(trips, key=lambda trip: len(trip.packages))
+                trip.packages.append(package)
+                self.package_trips[package.package_id] = trip
+                self.waiting_packages.remove(package)
+
+    # The earliest deadline of the packages a truck carries for each of its stops, in minutes since midnight. EOD
+    # packages and unknown addresses are left out.
+    # BIG O: O(m) where m is the number of packages on the truck
+    # Space Complexity: O(s) for s stops
+    def truck_stop_deadlines(self, truck_number):
+        deadlines = {}
+        for package in self.truck_packages[truck_number]:
+            stop = package.location
+            deadline = parse_clock_minutes(package.delivery_deadline)
+            if stop is not None and deadline is not None:
+                deadlines[stop] = min(deadline, deadlines.get(stop, deadline))
+        return deadlines
+
+    # Plans routes from the hub for the packages the given trucks carry now, by default every truck marked in
+    # replan_trucks, and clears their marks. With deadline_routing the routes are deadline aware, timed from when
+    # each truck left (or the day start for a truck still at the hub). Returns the new plans, which also replace
+    # those trucks' entries in truck_plans.
+    # BIG O: O(r * n^2) for r trucks, spread over worker processes by planner
+    # Space Complexity: O(r * n)
+    def replan(self, truck_numbers=None):
+        truck_numbers = sorted(self.replan_trucks if truck_numbers is None else truck_numbers)
+        deadlines = start_minutes = None
+        if self.deadline_routing:
+            deadlines = {truck_number: self.truck_stop_deadlines(truck_number) for truck_number in truck_numbers}
+            day_start = self._minutes(self.day_start)
+            start_minutes = {truck_number: self.truck_progress[truck_number].start_minutes
+                             if truck_number in self.truck_progress else day_start for truck_number in truck_numbers}
+        plans = self.planner.plan(
+            {truck_number: self.truck_route_indices(truck_number) for truck_number in truck_numbers},
+            improve=self.improve_routes, deadlines=deadlines, start_minutes=start_minutes, speed_mph=self.speed_mph)
+        self.truck_plans.update(plans)
+        self.replan_trucks.difference_update(truck_numbers)
+        return plans
+
+    # Queues the arrival at every stop of route after the first, then the return to the hub, for a truck that has
+    # already driven distance miles on its current trip. Arrivals of any earlier route for the truck are superseded.
+    # BIG O: O(s log e) for s stops with e events queued
+    # Space Complexity: O(s)
+    def schedule_route(self, truck_number, route, legs, distance=0):
+        progress = self.truck_progress[truck_number]
+        progress.route_number += 1
+        progress.stop_index = self.build_truck_stop_index(truck_number)
+        minutes_per_mile = 60 / self.speed_mph
+        for address, leg in zip(route[1:], legs):
+            distance += leg
+            self.events.schedule(progress.start_minutes + distance * minutes_per_mile, ARRIVE, truck_number, address,
+                                 data=(progress.route_number, distance))
+        distance += self.distance_matrix[route[-1]][0]
+        self.events.schedule(progress.start_minutes + distance * minutes_per_mile, RETURN, truck_number, 0,
+                             data=(progress.route_number, distance))
+
+    # Event handler: applies a manifest delta at its time.
+    def _on_delta(self, event):
+        self.apply_delta(event.data)
+
+    # Event handler: a delayed package reaches the hub. Its trip already waits for it, so this only marks the moment.
+    def _on_available(self, event):
+        pass
+
+    # Event handler: every trip leaving at this moment is loaded together, packages added during the day are put on
+    # them first, and their routes are planned in one call to planner so a large fleet spreads over worker
+    # processes. A truck leaves at the trip's departure time or when it got back to the hub, whichever is later.
+    def _on_depart(self, event):
+        wave = [event]
+        while self.events.peek() is not None and self.events.peek().time == event.time and \
+                self.events.peek().kind == DEPART:
+            wave.append(self.events.pop())
+        trips = [departure.data for departure in wave]
+        self.place_waiting_packages(trips, event.time)
+        for departure, trip in zip(wave, trips):
+            progress = self.truck_progress[trip.truck_number]
+            progress.start_minutes = departure.time
+            progress.start_time = max(self.day + timedelta(minutes=trip.departure),
+                                      progress.ready_time or self.day_start)
+            departure.packages = list(trip.packages)
+            self.load_trip(trip, progress.start_time)
+        plans = self.replan([trip.truck_number for trip in trips])
+        for trip in trips:
+            plan = plans[trip.truck_number]
+            self.route_plans.append((trip, plan))
+            self.schedule_route(trip.truck_number, plan.route, plan.legs)
+        for departure in wave[1:]:
+            self.events.notify(departure)
+
+    # Event handler: a truck reaches a stop and delivers the packages it carries for that address. If its load
+    # changed since the route was planned, the rest of the route is replanned from here. Arrivals of a replaced
+    # route are stale.
+    def _on_arrive(self, event):
+        progress = self.truck_progress[event.truck]
+        route_number, distance = event.data
+        if route_number != progress.route_number:
+            return False
+        delivered = progress.stop_index.pop(event.address, ())
+        if delivered:
+            timestamp = progress.start_time + timedelta(minutes=(distance / self.speed_mph) * 60)
+            for package in delivered:
+                package.status = "Delivered"
+                package.truck_number = event.truck
+                package.distance = distance
+                package.timestamp = timestamp
+                package.status_tracker.append(timestamp, package.status)
+            on_truck = self.truck_packages[event.truck]
+            on_truck[:] = [package for package in on_truck if package.status != "Delivered"]
+            self.truck_package_counts[event.truck] -= len(delivered)
+            event.packages = delivered
+        if event.truck in self.replan_trucks:
+            self.replan_trucks.discard(event.truck)
+            if self.deadline_routing:
+                route, legs = find_deadline_route_and_distances(
+                    self.distance_matrix, self.truck_route_indices(event.truck),
+                    self.truck_stop_deadlines(event.truck), event.time, self.speed_mph, start=event.address)
+            else:
+                route, legs = find_nearest_neighbor_route_and_distances(
+                    self.distance_matrix, self.truck_route_indices(event.truck), start=event.address)
+            self.schedule_route(event.truck, route, legs, distance)
+
+    # Event handler: a truck is back at the hub; its next trip, if it has one, is queued to leave. The return of a
+    # replaced route is stale.
+    def _on_return(self, event):
+        progress = self.truck_progress[event.truck]
+        route_number, distance = event.data
+        if route_number != progress.route_number:
+            return False
+        self.total_distance += distance
+        progress.ready_time = progress.start_time + timedelta(minutes=(distance / self.speed_mph) * 60)
+        if progress.next_trips:
+            trip = progress.next_trips.pop(0)
+            self.events.schedule(max(trip.departure, event.time), DEPART, trip.truck_number, 0, data=trip)
+
+    # Runs the whole day as a discrete-event simulation. The data directory's address corrections join the pending
+    # deltas, the deltas due before the day starts are applied and every package is assigned to a trip; then each
+    # truck's first departure, each pending delta and each delayed package's arrival at the hub is queued, and the
+    # EventQueue hands the events to the _on_* handlers in time order, so every truck's departures, stop arrivals and
+    # returns interleave on one clock. The planner's worker pool, if it started one, is closed once the day is over.
+    # Returns the total distance driven.
+    # BIG O: O(e log e + t * n^2) for e events and t trips of n stops
+    # Space Complexity: O(n + e)
+    def run(self):
+        if self.has_run:
+            return self.total_distance
+        day_start = self._minutes(self.day_start)
+        # A stable sort puts each correction before deltas ingested for the same time, so those can still override it
+        self.pending_deltas = sorted(self.address_corrections + self.pending_deltas, key=lambda delta: delta.time)
+        while self.pending_deltas and self.pending_deltas[0].time <= day_start:
+            self.apply_delta(self.pending_deltas.pop(0))
+        self.assign_trips()
+        events = self.events
+        for delta in self.pending_deltas:
+            events.schedule(delta.time, DELTA, data=delta)
+        self.pending_deltas.clear()
+        for package_id, package in self.packages_table:
+            if package.package_special_notes:
+                available_at = self.constraints_of(package).available_at
+                if available_at is not None and available_at > day_start:
+                    events.schedule(available_at, AVAILABLE, packages=(package,))
+        # Each truck's first trip is queued now and the rest follow it back to the hub, in departure order
+        for trip in self.trips:
+            if trip.truck_number in self.truck_progress:
+                self.truck_progress[trip.truck_number].next_trips.append(trip)
+            else:
+                self.truck_progress[trip.truck_number] = _TruckProgress()
+                events.schedule(max(trip.departure, day_start), DEPART, trip.truck_number, 0, data=trip)
+        try:
+            events.run({DELTA: self._on_delta, AVAILABLE: self._on_available, DEPART: self._on_depart,
+                        ARRIVE: self._on_arrive, RETURN: self._on_return})
+        finally:
+            self.planner.close()
+        # Packages added too late for any departure were never loaded
+        self.unassigned_packages.extend(self.waiting_packages)
+        self.waiting_packages.clear()
+        self.has_run = True
+        return self.total_distance
+
+    # The status of every package at timestamp, as (package_id, package, status, status_time) in table order.
+    # BIG O: O(n log h)
+    # Space Complexity: O(1)
+    def status_at(self, timestamp):
+        return fleet_status_at(self.packages_table, timestamp)
+
+    # Packages delivered after their deadline, or not delivered at all by the end of the day, as
+    # (package, delivered_at, deadline) in table order. delivered_at is None for packages never delivered and the
+    # deadline is minutes since midnight.
+    # BIG O: O(n)
+    # Space Complexity: O(l) for l late packages
+    def late_packages(self):
+        late = []
+        for package_id, package in self.packages_table:
+            deadline = parse_clock_minutes(package.delivery_deadline)
+            if deadline is None:
+                continue
+            if package.status != "Delivered":
+                late.append((package, None, deadline))
+            elif package.timestamp > self.day + timedelta(minutes=deadline):
+                late.append((package, package.timestamp, deadline))
+        return late
+
+    # A columnar snapshot of the manifest as it stands now, for vectorized fleet-wide filters such as
+    # manifest_store().select(status="At Hub", truck=2).
+    # BIG O: O(n)
+    # Space Complexity: O(n)
+    def manifest_store(self):
+        return ManifestStore.from_packages(self.packages_table, self.address_book)
+
+
+# Where one truck is in its day: when and where its current trip started, which route of that trip is live (an
+# earlier route's arrivals are ignored once it is replanned), the packages it still carries by stop, when it got
+# back to the hub, and the trips it has yet to drive.
+# BIG O: O(1)
+# Space Complexity: O(m) for the packages on the truck
+class _TruckProgress:
+    __slots__ = ('start_minutes', 'start_time', 'route_number', 'stop_index', 'ready_time', 'next_trips')
+
+    def __init__(self):
+        self.start_minutes = 0
+        self.start_time = None
+        self.route_number = 0
+        self.stop_index = {}
+        self.ready_time = None
+        self.next_trips = []
@@ -0,0 +1,56 @@
+from bisect import bisect_right
+
+
+# An append-only log of one package's status changes, kept sorted by time in two parallel lists so that the status
+# at any moment is a single binary search. Changes normally arrive in time order and are appended; one that arrives
+# late is inserted in place.
+# BIG O: O(1) amortized to record an in-order change, O(log h) to query, where h is the length of the history
+# Space Complexity: O(h)
+class StatusHistory:
+    __slots__ = ('times', 'statuses')
+
+    def __init__(self, status=None, timestamp=None):
+        self.times = []
+        self.statuses = []
+        if status is not None and timestamp is not None:
+            self.append(timestamp, status)
+
+    def __len__(self):
+        return len(self.times)
+
+    def __iter__(self):
+        return zip(self.times, self.statuses)
+
+    def append(self, timestamp, status):
+        if not self.times or timestamp >= self.times[-1]:
+            self.times.append(timestamp)
+            self.statuses.append(status)
+        else:
+            # Later than every entry already at this time, so the newest change at a given time wins
+            index = bisect_right(self.times, timestamp)
+            self.times.insert(index, timestamp)
+            self.statuses.insert(index, status)
+
+    # Returns the status in effect at timestamp and the time it took effect, or (None, None) before the first entry.
+    # BIG O: O(log h)
+    # Space Complexity: O(1)
+    def status_at(self, timestamp):
+        index = bisect_right(self.times, timestamp) - 1
+        if index < 0:
+            return None, None
+        return self.statuses[index], self.times[index]
+
+
+# The status of every package at one moment, worked out in a single pass over the packages with one binary search
+# each. packages is an iterable of (package_id, package) pairs, such as a HashTable; yields (package_id, package,
+# status, status_time) in the same order, with (None, None) for a package that has no status yet at timestamp.
+# BIG O: O(n log h)
+# Space Complexity: O(1)
+def fleet_status_at(packages, timestamp):
+    for package_id, package in packages:
+        history = package.status_tracker
+        index = bisect_right(history.times, timestamp) - 1
+        if index < 0:
+            yield package_id, package, None, None
+        else:
+            yield package_id, package, history.statuses[index], history.times[index]